@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: © 2024 Stacey Adams <stacey.belle.rose@gmail.com>
+# SPDX-License-Identifier: MIT
+
+"""
+Minimal INI-style configuration parser.
+
+The stdlib ConfigParser builds interpolation machinery and per-line
+state objects that the application's small, flat settings file never
+needs. This parser handles only `[section]` headers and `key = value`
+lines, matched in a single regex pass, and exposes just the surface
+`Settings` uses.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import IO
+
+_LINE_RE = re.compile(r"^\[([^\]]+)\]\s*$|^([^=\s;#][^=]*?)\s*=\s*(.*)$", re.MULTILINE)
+"""Matches a section header or a key/value assignment.
+
+Keys may not start with `;` or `#`, so comment lines are skipped even
+when their text contains an `=`.
+"""
+
+_BOOLEAN_STATES = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False
+}
+"""The value spellings ConfigParser accepts for booleans."""
+
+
+class FastConfigSection(dict):
+    """
+    One section of a configuration file.
+
+    A plain dict of strings, extended with the typed accessors that
+    stdlib ConfigParser sections provide.
+    """
+
+    def get(  # type: ignore[override]
+        self, key: str, *, fallback: str | None = None
+    ) -> str | None:
+        """
+        Get a value from the section.
+
+        Parameters
+        ----------
+        key : str
+            The key to look up.
+        fallback : str, optional
+            The value to return when the key is not present.
+        """
+        return super().get(key, fallback)
+
+    def getint(self, key: str, *, fallback: int = 0) -> int:
+        """
+        Get a value from the section, parsed as an integer.
+
+        Parameters
+        ----------
+        key : str
+            The key to look up.
+        fallback : int, optional
+            The value to return when the key is missing or malformed.
+        """
+        value = super().get(key)
+        if value is None:
+            return fallback
+        try:
+            return int(value)
+        except ValueError:
+            return fallback
+
+    def getboolean(self, key: str, *, fallback: bool = False) -> bool:
+        """
+        Get a value from the section, parsed as a boolean.
+
+        Parameters
+        ----------
+        key : str
+            The key to look up.
+        fallback : bool, optional
+            The value to return when the key is missing or malformed.
+        """
+        value = super().get(key)
+        if value is None:
+            return fallback
+        state = _BOOLEAN_STATES.get(value.lower())
+        return fallback if state is None else state
+
+
+class FastConfigParser:
+    """
+    Parse and write flat INI-style configuration files.
+
+    Only `[section]` headers and `key = value` lines are supported;
+    interpolation, multi-line values, and comments-after-values are not.
+    """
+
+    def __init__(self) -> None:
+        """
+        Construct a parser with no sections.
+        """
+        self._sections: dict[str, FastConfigSection] = {}
+
+    def read(self, filename: str | Path) -> None:
+        """
+        Read a configuration file, merging it into the current sections.
+
+        Missing or unreadable files are ignored, matching ConfigParser.
+
+        Parameters
+        ----------
+        filename : str | Path
+            The full path to the configuration file.
+        """
+        try:
+            text = Path(filename).read_text(encoding="utf-8")
+        except OSError:
+            return
+        section: FastConfigSection | None = None
+        for match in _LINE_RE.finditer(text):
+            header, key, value = match.groups()
+            if header is not None:
+                section = self._sections.setdefault(
+                    header.strip(), FastConfigSection()
+                )
+            elif section is not None:
+                section[key] = value.strip()
+
+    def write(self, file: IO[str]) -> None:
+        """
+        Write the sections to an open file in INI format.
+
+        Parameters
+        ----------
+        file : IO[str]
+            A writable text file object.
+        """
+        for name, section in self._sections.items():
+            file.write(f"[{name}]\n")
+            for key, value in section.items():
+                file.write(f"{key} = {value}\n")
+            file.write("\n")
+
+    def sections(self) -> list[str]:
+        """
+        List the section names.
+        """
+        return list(self._sections)
+
+    def has_section(self, name: str) -> bool:
+        """
+        Check whether a section exists.
+
+        Parameters
+        ----------
+        name : str
+            The section name.
+        """
+        return name in self._sections
+
+    def add_section(self, name: str) -> None:
+        """
+        Add an empty section.
+
+        Parameters
+        ----------
+        name : str
+            The section name.
+        """
+        self._sections.setdefault(name, FastConfigSection())
+
+    def __getitem__(self, name: str) -> FastConfigSection:
+        """
+        Get a section by name.
+
+        Parameters
+        ----------
+        name : str
+            The section name.
+        """
+        return self._sections[name]
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import dataclasses
 from enum import Enum
+from functools import lru_cache
 from tkinter import font
 from tkinter.font import Font
 from typing import Literal, TypeVar
@@ -227,6 +228,32 @@ def modify_named_font(  # pylint: disable=too-many-arguments
     return Font(name="TkDefaultFont")
 
 
+@lru_cache(maxsize=64)
+def sized_named_font(font_name: str, size: int) -> Font:
+    """
+    Get a copy of a named font at a given size, shared across callers.
+
+    Widgets built in batches, like the meters on the main window, ask
+    for the same few (name, size) combinations repeatedly; memoizing
+    lets them share one Font object per combination. The cache is
+    cleared by `StyleManager.init_fonts` when the underlying named
+    fonts are reconfigured.
+
+    Parameters
+    ----------
+    font_name : str
+        The name of the font to use
+    size : int
+        The font size to use
+
+    Returns
+    -------
+    Font
+        A font with the given size, shared with other callers.
+    """
+    return modify_named_font(font_name, size=size)
+
+
 def get_with_fallback(value: T | None, fallback: T) -> T:
     """
     Return the value provided unless it is None. In that case, return the fallback.
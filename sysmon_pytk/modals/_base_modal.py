@@ -22,6 +22,11 @@ if TYPE_CHECKING:
 
 _ = get_translator()
 
+_CLOSE_LABEL = _("Close")
+_CANCEL_LABEL = _("Cancel")
+_OK_LABEL = _("OK")
+"""Pre-translated button labels; the module is reloaded on language change."""
+
 # These lint errors don't make sense for GUI widgets, so are disabled here.
 # pragma pylint: disable=too-many-instance-attributes
 
@@ -155,7 +160,7 @@ class ModalDialog(ButtonMixin, tk.Toplevel, metaclass=ABCMeta):
         Add a Close button to the bottom row of the modal dialog.
         """
         buttons = [
-            ButtonDefinition(text=_("Close"), command=self.dismiss),
+            ButtonDefinition(text=_CLOSE_LABEL, command=self.dismiss),
         ]
         self.add_buttons(self.internal_frame, buttons=buttons, default=0)
 
@@ -165,8 +170,8 @@ class ModalDialog(ButtonMixin, tk.Toplevel, metaclass=ABCMeta):
         Add OK and Cancel buttons to the bottom row of the modal dialog.
         """
         buttons = [
-            ButtonDefinition(text=_("Cancel"), command=self.dismiss),
-            ButtonDefinition(text=_("OK"), command=self.save_and_dismiss),
+            ButtonDefinition(text=_CANCEL_LABEL, command=self.dismiss),
+            ButtonDefinition(text=_OK_LABEL, command=self.save_and_dismiss),
         ]
         self.add_buttons(self.internal_frame, buttons=buttons, default=1)
 
@@ -16,7 +16,7 @@ from uuid import uuid4
 from .._common import INTERNAL_PAD
 from ..app_locale import get_translator
 from ..file_utils import get_full_path, get_main_script
-from ..translator import TRANSLATORS, Translator
+from ..translator import Translator, get_translators
 from ..widgets import ScrollingText, TextToolTip
 from ._base_modal import ModalDialog
 
@@ -192,7 +192,7 @@ class AboutDialog(ModalDialog):
             undo=False, relief=tk.FLAT
         )
         tab = text.get_frame()
-        for language, translator_list in TRANSLATORS.items():
+        for language, translator_list in get_translators().items():
             text.insert(tk.END, f"{language}: ", "bold")
             for idx, translator in enumerate(translator_list):
                 self._add_translator(text, translator, idx, len(translator_list))
@@ -208,9 +208,9 @@ class AboutDialog(ModalDialog):
             token = uuid4().hex
             text.insert(tk.END, " (")
             text.insert(tk.END, f"{translator.github_username} @ GitHub", ("link", token))
-            text.insert(tk.END, translator.github_url(), "linkurl")
+            text.insert(tk.END, translator.url, "linkurl")
             text.insert(tk.END, ")")
-            TextToolTip(text, translator.github_url(), token)
+            TextToolTip(text, translator.url, token)
         if idx < max_items-1:
             text.insert(tk.END, ", ")
         else:
@@ -15,6 +15,7 @@ import psutil
 
 from .. import _common
 from ..app_locale import get_translator
+from ..sampler import SAMPLER
 from ..widgets import Meter
 from ._base_modal import ModalDialog
 
@@ -138,7 +139,7 @@ class CpuDialog(ModalDialog):
         """
         Update the modal dialog window.
         """
-        usage = psutil.cpu_percent(interval=None, percpu=True)
+        usage = SAMPLER.cpu_percent_percpu()
         for core in range(self.cpu_count):
             self._meters[core].set_value(usage[core])
         freqs = psutil.cpu_freq(percpu=True)
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 import psutil
 
@@ -18,10 +18,20 @@ from ..app_locale import get_translator
 from ._base_modal import ModalDialog
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from tkinter import Misc
 
+    class _DiskPartition(Protocol):
+        """The part of a psutil disk partition tuple this dialog reads."""
+
+        @property
+        def mountpoint(self) -> str: ...
+
 _ = get_translator()
 
+_DISK_USAGE_HEADER = _("Disk Usage")
+"""Pre-translated header text; the module is reloaded on language change."""
+
 
 class DiskUsageDialog(ModalDialog):
     """
@@ -54,21 +64,29 @@ class DiskUsageDialog(ModalDialog):
         This dialog does not need a save feature.
         """
 
-    def create_widgets(self) -> None:
+    def create_widgets(self, partitions: Sequence[_DiskPartition] | None = None) -> None:
         """
         Create the widgets to be displayed in the modal dialog.
+
+        Parameters
+        ----------
+        partitions : Sequence[_DiskPartition], optional
+            A prebuilt partitions snapshot to use instead of re-scanning.
         """
         self._diskmounts: list[str] = []
         self._diskusages: list[tk.IntVar] = []
         self._diskusagefmts: list[tk.StringVar] = []
         self._disklabels: list[ttk.Label] = []
-        for part in psutil.disk_partitions():
+        if partitions is None:
+            partitions = psutil.disk_partitions(all=False)
+        for part in partitions:
             self._diskmounts.append(part.mountpoint)
             self._diskusages.append(tk.IntVar())
             self._diskusagefmts.append(tk.StringVar())
+        self._mounts_set = frozenset(self._diskmounts)
         self.internal_frame.columnconfigure(0, weight=1)
         ttk.Label(
-            self.internal_frame, text=_("Disk Usage"), font=self.large_font,
+            self.internal_frame, text=_DISK_USAGE_HEADER, font=self.large_font,
             anchor=tk.CENTER
         ).grid(columnspan=2, sticky=tk.NSEW, ipady=_common.INTERNAL_PAD)
         self._create_mount_widgets()
@@ -97,31 +115,40 @@ class DiskUsageDialog(ModalDialog):
                 sticky=tk.NSEW
             )
 
-    def reset(self) -> None:
+    def reset(self, partitions: Sequence[_DiskPartition] | None = None) -> None:
         """
         Reset the dialog.
+
+        Parameters
+        ----------
+        partitions : Sequence[_DiskPartition], optional
+            A prebuilt partitions snapshot to use instead of re-scanning.
         """
         if self._update_job is not None:
             self.after_cancel(self._update_job)
             self._update_job = None
         self.internal_frame.destroy()
-        self.create_widgets()
+        self.create_widgets(partitions)
         self.update_screen()
 
-    def check_mount_points(self) -> bool:
+    def _scan_mounts(self) -> Sequence[_DiskPartition] | None:
         """
-        Check to see if any additional mount points have appeared.
+        Scan the disk partitions for additional mount points.
+
+        Returns the new partitions snapshot if any have appeared, else None.
         """
-        return any(
-            part.mountpoint not in self._diskmounts for part in psutil.disk_partitions()
-        )
+        partitions = psutil.disk_partitions(all=False)
+        if any(part.mountpoint not in self._mounts_set for part in partitions):
+            return partitions
+        return None
 
     def update_screen(self) -> None:
         """
         Update the modal dialog window.
         """
-        if self.check_mount_points():
-            self.reset()
+        partitions = self._scan_mounts()
+        if partitions is not None:
+            self.reset(partitions)
             return
         # process the mount points
         try:
@@ -8,6 +8,7 @@ Application font settings modal dialog.
 from __future__ import annotations
 
 import tkinter as tk
+from bisect import bisect_left
 from tkinter import font, ttk
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,27 @@ _ = get_translator()
 # These lint errors don't make sense for GUI widgets, so are disabled here.
 # pragma pylint: disable=too-many-instance-attributes
 
+_STYLE_TABLE: dict[str, tuple[FontWeight, FontSlant]] = {
+    style.value: style.to_weight_and_slant() for style in FontStyle
+}
+"""Weight and slant for each font style value, to avoid per-call branching."""
+
+_FAMILIES_CACHE: list[str] | None = None
+
+
+def _get_families() -> list[str]:
+    """
+    Get a sorted list of the font families available on the system.
+
+    The list is cached at module scope, since the set of installed fonts
+    rarely changes while the application is running, and querying Tk for
+    it is expensive on systems with many fonts.
+    """
+    global _FAMILIES_CACHE  # noqa: PLW0603  # pylint: disable=global-statement
+    if _FAMILIES_CACHE is None:
+        _FAMILIES_CACHE = sorted(dict.fromkeys(font.families()))
+    return _FAMILIES_CACHE
+
 
 class FontChooser(ModalDialog):
     """
@@ -73,8 +95,8 @@ class FontChooser(ModalDialog):
         """
         title = _("Choose Font")
         self.current_font = current_font
-        self.fontchoices = list(set(font.families()))
-        self.fontchoices.sort()
+        self._preview_after: str | None = None
+        self.fontchoices = _get_families()
         self.fontsize = tk.IntVar()
         self.fontstyle = tk.StringVar()
         self.underline = tk.BooleanVar()
@@ -132,25 +154,58 @@ class FontChooser(ModalDialog):
             familyframe, text=_("Font"), font=self.base_font
         ).grid(row=0, sticky=tk.NSEW)
         choicesvar = tk.StringVar(value=self.fontchoices)  # type: ignore[arg-type]
+        bg1 = StyleManager.test_dark_mode("#333333", "#ffffff")
+        bg2 = StyleManager.test_dark_mode("#444444", "#eeeeff")
         lbox = tk.Listbox(
             familyframe, listvariable=choicesvar, height=10, width=30, bd=1,
-            exportselection=0, relief=tk.FLAT, background="#555555",
+            exportselection=0, relief=tk.FLAT, background=bg2,
             font=self.base_font
         )
-        bg1 = StyleManager.test_dark_mode("#333333", "#ffffff")
-        bg2 = StyleManager.test_dark_mode("#444444", "#eeeeff")
-        for idx, item in enumerate(self.fontchoices):
-            item_bg = bg1 if idx % 2 else bg2
-            lbox.itemconfig(idx, background=item_bg)
-            if item == self.fontname:
+        self._lbox = lbox
+        self._stripe_color = bg1
+        self._striped: set[int] = set()
+        if self.fontname is not None:
+            idx = bisect_left(self.fontchoices, self.fontname)
+            if idx < len(self.fontchoices) and self.fontchoices[idx] == self.fontname:
                 lbox.selection_set(idx)
-                lbox.see(idx)
+                total = len(self.fontchoices)
+                first_frac, last_frac = lbox.yview()
+                # only scroll when the match is outside the visible window
+                if last_frac - first_frac >= 1.0 or not (
+                    first_frac * total <= idx < last_frac * total
+                ):
+                    lbox.see(idx)
         lbox.grid(row=1, column=0, sticky=tk.NSEW)
         scroll = ttk.Scrollbar(familyframe, orient=tk.VERTICAL)
         scroll.grid(row=1, column=1, sticky=tk.NS)
-        lbox.config(yscrollcommand=scroll.set)
+        self._family_scroll = scroll
+        lbox.config(yscrollcommand=self._on_family_scroll)
         scroll.config(command=lbox.yview)
         lbox.bind("<<ListboxSelect>>", self._on_select)
+        lbox.bind("<Configure>", self._stripe_visible_rows)
+
+    def _on_family_scroll(self, first: float, last: float) -> None:
+        # Tk actually passes the fractions as strings, but the stubs
+        # declare yscrollcommand with floats and Scrollbar.set takes both
+        self._family_scroll.set(first, last)
+        self._stripe_visible_rows()
+
+    def _stripe_visible_rows(self, *_args) -> None:
+        """
+        Zebra-stripe only the odd rows currently scrolled into view.
+
+        Striping is done lazily because issuing an itemconfig per row up
+        front stalls the dialog when thousands of fonts are installed.
+        """
+        total = len(self.fontchoices)
+        first_frac, last_frac = self._lbox.yview()
+        first = int(first_frac * total)
+        last = min(int(last_frac * total) + 1, total)
+        start = first if first % 2 else first + 1
+        for idx in range(start, last, 2):
+            if idx not in self._striped:
+                self._striped.add(idx)
+                self._lbox.itemconfig(idx, background=self._stripe_color)
 
     def _create_font_option_widgets(self) -> None:
         styleframe = ttk.LabelFrame(
@@ -227,16 +282,21 @@ class FontChooser(ModalDialog):
         ).grid(sticky=tk.NSEW)
 
     def _update_preview(self, *_args) -> None:
-        try:
-            fontstyle = FontStyle(self.fontstyle.get())
-        except ValueError:
-            fontstyle = FontStyle.REGULAR
+        # Debounce: dragging the size slider fires one trace per step, but
+        # only the final value needs to reconfigure the preview font.
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+        self._preview_after = self.after(50, self._apply_preview)
+
+    def _apply_preview(self) -> None:
+        self._preview_after = None
         if self.fontname:
+            weight, slant = _STYLE_TABLE.get(self.fontstyle.get(), ("normal", "roman"))
             self.preview_font.configure(
                 family=self.fontname,
                 size=self.fontsize.get(),
-                weight=fontstyle.get_weight(),
-                slant=fontstyle.get_slant(),
+                weight=weight,
+                slant=slant,
                 underline=self.underline.get(),
                 overstrike=self.overstrike.get()
             )
@@ -250,15 +310,7 @@ class FontChooser(ModalDialog):
         """
         Update `self.current_font` based on currently selected options.
         """
-        weight: FontWeight = "normal"
-        slant: FontSlant = "roman"
-        if self.fontstyle.get() == FontStyle.BOLD:
-            weight = "bold"
-        elif self.fontstyle.get() == FontStyle.ITALIC:
-            slant = "italic"
-        elif self.fontstyle.get() == FontStyle.BOLD_ITALIC:
-            weight = "bold"
-            slant = "italic"
+        weight, slant = _STYLE_TABLE.get(self.fontstyle.get(), ("normal", "roman"))
         self.current_font = FontDescription(
             family=self.fontname,
             size=self.fontsize.get(),
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
+from typing import TYPE_CHECKING, Callable
 
 import psutil
 
@@ -16,6 +17,9 @@ from .. import _common
 from ..app_locale import get_translator
 from ._base_modal import ModalDialog
 
+if TYPE_CHECKING:
+    from tkinter import Misc
+
 _ = get_translator()
 
 
@@ -24,6 +28,25 @@ class MemUsageDialog(ModalDialog):
     Display memory usage in a modal dialog.
     """
 
+    def __init__(
+        self, parent: Misc | None = None, *, title: str | None = None,
+        iconpath: str | None = None
+    ) -> None:
+        """
+        Construct a modal dialog containing information about memory usage.
+
+        Parameters
+        ----------
+        parent : Misc, optional
+            The parent widget.
+        title : str, optional
+            The title to display in the window title bar.
+        iconpath : str, optional
+            The path to the icon to display in the window title bar.
+        """
+        self._update_job: str | None = None
+        super().__init__(parent, title=title, iconpath=iconpath)
+
     def on_save(self) -> None:
         """
         Save what was entered in the modal dialog.
@@ -35,18 +58,19 @@ class MemUsageDialog(ModalDialog):
         """
         Create the widgets to be displayed in the modal dialog.
         """
-        mem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        self._names: list[str] = []
-        self._metrics: list[tk.StringVar] = []
-        self._swaps: list[str] = []
-        self._swap_metrics: list[tk.StringVar] = []
-        for item in mem._asdict():
-            self._names.append(item)
-            self._metrics.append(tk.StringVar())
-        for item in swap._asdict():
-            self._swaps.append(item)
-            self._swap_metrics.append(tk.StringVar())
+        if not hasattr(self, "_names"):
+            # the field schema is fixed, so names and formatters are built
+            # only once even when the widgets are rebuilt
+            self._names: list[str] = list(psutil.virtual_memory()._fields)
+            self._swaps: list[str] = list(psutil.swap_memory()._fields)
+            self._formatters = [self._get_formatter(name) for name in self._names]
+            self._swap_formatters = [
+                self._get_formatter(name) for name in self._swaps
+            ]
+        self._mem_labels: list[ttk.Label] = []
+        self._swap_labels: list[ttk.Label] = []
+        self._last_values = [""] * len(self._names)
+        self._last_swap_values = [""] * len(self._swaps)
         self.internal_frame.columnconfigure(0, weight=1)
         self.internal_frame.columnconfigure(2, weight=4)
         self.internal_frame.columnconfigure(3, weight=1)
@@ -64,32 +88,51 @@ class MemUsageDialog(ModalDialog):
             anchor=tk.CENTER
         ).grid(row=1, column=3, columnspan=2, sticky=tk.NSEW)
         self.internal_frame.columnconfigure(2, minsize=4*_common.INTERNAL_PAD)
-        self._create_detail_widgets()
         max_list = max(len(self._names), len(self._swaps))
+        self._create_detail_widgets(max_list)
         for i in range(2, max_list+2):
             self.internal_frame.rowconfigure(i, weight=1)
         self.add_close_button()
         self.add_sizegrip()
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Map>", self._on_map)
+
+    def _on_unmap(self, event: tk.Event) -> None:
+        # pause the refresh timer while the dialog is iconified or hidden
+        if event.widget is self and self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+
+    def _on_map(self, event: tk.Event) -> None:
+        if event.widget is self and self._update_job is None:
+            self.update_screen()
 
-    def _create_detail_widgets(self) -> None:
-        for count, name in enumerate(self._names):
-            ttk.Label(
-                self.internal_frame, text=name.capitalize(), anchor=tk.W,
-                font=self.base_font
-            ).grid(row=count+2, column=0, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
-            ttk.Label(
-                self.internal_frame, textvariable=self._metrics[count], anchor=tk.E,
-                font=self.fixed_font
-            ).grid(row=count+2, column=1, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
-        for count, name in enumerate(self._swaps):
-            ttk.Label(
-                self.internal_frame, text=name.capitalize(), anchor=tk.W,
-                font=self.base_font
-            ).grid(row=count+2, column=3, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
-            ttk.Label(
-                self.internal_frame, textvariable=self._swap_metrics[count],
-                font=self.fixed_font, anchor=tk.E
-            ).grid(row=count+2, column=4, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
+    def _create_detail_widgets(self, max_list: int) -> None:
+        for count in range(max_list):
+            if count < len(self._names):
+                ttk.Label(
+                    self.internal_frame, text=self._names[count].capitalize(),
+                    anchor=tk.W, font=self.base_font
+                ).grid(row=count+2, column=0, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
+                metric_label = ttk.Label(
+                    self.internal_frame, anchor=tk.E, font=self.fixed_font
+                )
+                metric_label.grid(
+                    row=count+2, column=1, sticky=tk.NSEW, padx=_common.INTERNAL_PAD
+                )
+                self._mem_labels.append(metric_label)
+            if count < len(self._swaps):
+                ttk.Label(
+                    self.internal_frame, text=self._swaps[count].capitalize(),
+                    anchor=tk.W, font=self.base_font
+                ).grid(row=count+2, column=3, sticky=tk.NSEW, padx=_common.INTERNAL_PAD)
+                swap_label = ttk.Label(
+                    self.internal_frame, font=self.fixed_font, anchor=tk.E
+                )
+                swap_label.grid(
+                    row=count+2, column=4, sticky=tk.NSEW, padx=_common.INTERNAL_PAD
+                )
+                self._swap_labels.append(swap_label)
 
     def update_screen(self) -> None:
         """
@@ -97,11 +140,26 @@ class MemUsageDialog(ModalDialog):
         """
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        for count, item in enumerate(mem._asdict().items()):
-            self._metrics[count].set(self._format_mem_item(item))
-        for count, item in enumerate(swap._asdict().items()):
-            self._swap_metrics[count].set(self._format_mem_item(item))
-        self.after(_common.REFRESH_INTERVAL, self.update_screen)
-
-    def _format_mem_item(self, item: tuple) -> str:
-        return _common.bytes2human(item[1]) if item[0] != "percent" else f"{item[1]}%"
+        for count, formatter in enumerate(self._formatters):
+            text = formatter(mem[count])
+            # skip the Tcl round-trip when the displayed text is unchanged
+            if text != self._last_values[count]:
+                self._last_values[count] = text
+                self._mem_labels[count].configure(text=text)
+        for count, formatter in enumerate(self._swap_formatters):
+            text = formatter(swap[count])
+            if text != self._last_swap_values[count]:
+                self._last_swap_values[count] = text
+                self._swap_labels[count].configure(text=text)
+        self._update_job = self.after(_common.REFRESH_INTERVAL, self.update_screen)
+
+    @classmethod
+    def _get_formatter(cls, name: str) -> Callable[[float], str]:
+        """
+        Resolve the formatter for a field once, at widget-creation time.
+        """
+        if name == "percent":
+            return lambda value: f"{value}%"
+        # bytes2human takes an int and an optional precision; adapt it
+        # to the declared single-float shape
+        return lambda value: _common.bytes2human(int(value))
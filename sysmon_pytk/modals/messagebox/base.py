@@ -11,8 +11,8 @@ Themed message boxes.
 from __future__ import annotations
 
 import tkinter as tk
-from contextlib import suppress
 from enum import IntEnum
+from functools import lru_cache
 from tkinter import ttk
 from typing import Callable
 
@@ -66,6 +66,25 @@ MESSAGE_BOX_ICON_PATHS = {
 }
 
 
+_BUTTON_SET_METHODS = {
+    MessageBoxButtonSet.OK: "add_ok_button",
+    MessageBoxButtonSet.OKCANCEL: "add_ok_cancel_buttons",
+    MessageBoxButtonSet.CLOSE: "add_close_button",
+    MessageBoxButtonSet.YESNO: "add_yes_no_buttons",
+    MessageBoxButtonSet.YESNOCANCEL: "add_yes_no_cancel_buttons",
+    MessageBoxButtonSet.RETRYCANCEL: "add_retry_cancel_buttons"
+}
+"""The MessageBox method used to add the buttons for each button set."""
+
+
+@lru_cache(maxsize=len(MESSAGE_BOX_ICON_PATHS))
+def _load_icon(icon: MessageBoxIcon) -> tk.PhotoImage:
+    """
+    Load a standard message box icon, cached so the PNG is decoded once.
+    """
+    return tk.PhotoImage(file=get_full_path(MESSAGE_BOX_ICON_PATHS[icon]))
+
+
 class MessageBox(ButtonMixin, tk.Toplevel):
     """
     Message box modal dialog.
@@ -86,8 +105,18 @@ class MessageBox(ButtonMixin, tk.Toplevel):
         The default button number.
     internal_frame : ttk.Frame
         A frame to hold the message box contents.
+    keep_alive : bool
+        Whether dismissing hides the message box instead of destroying it,
+        so the instance can be reshown later.
     """
 
+    _OK_BUTTONS = (ButtonName.OK,)
+    _OK_CANCEL_BUTTONS = (ButtonName.CANCEL, ButtonName.OK)
+    _CLOSE_BUTTONS = (ButtonName.CLOSE,)
+    _YES_NO_BUTTONS = (ButtonName.NO, ButtonName.YES)
+    _YES_NO_CANCEL_BUTTONS = (ButtonName.CANCEL, ButtonName.NO, ButtonName.YES)
+    _RETRY_CANCEL_BUTTONS = (ButtonName.CANCEL, ButtonName.RETRY)
+
     def __init__(
         self, parent: tk.Misc | None = None, *,
         title: str | None = None,
@@ -96,7 +125,9 @@ class MessageBox(ButtonMixin, tk.Toplevel):
         custom_icon: tk.PhotoImage | None = None,
         button_set: MessageBoxButtonSet = MessageBoxButtonSet.OK,
         button_list: list[ButtonName] | None = None,
-        default: int = -1
+        default: int = -1,
+        keep_alive: bool = False,
+        modal: bool = True
     ) -> None:
         """
         Construct a messagebox.
@@ -119,67 +150,130 @@ class MessageBox(ButtonMixin, tk.Toplevel):
             A list of buttons to display in the message box, overrides button_set.
         default : int
             The default button number.
+        keep_alive : bool
+            When True, dismissing hides the message box instead of
+            destroying it, so the instance can be reshown later.
+        modal : bool
+            When False, `show` displays the message box and returns
+            immediately instead of waiting for an answer.
         """
         super().__init__(parent, class_="MessageBox")
+        # withdraw immediately so Tk never maps a half-built window
+        self.wm_withdraw()
         self.message = message
         self.icon = icon
         self.custom_icon = custom_icon
         self.button_set = button_set
         self.button_list = button_list
         self.default = default
+        self.keep_alive = keep_alive
+        self.modal = modal
+        self._done = tk.IntVar(self)
         self._set_standard_icon()
         self.internal_frame = ttk.Frame(self)
         self.internal_frame.grid(sticky=tk.NSEW)
         self.title(title)
+        self.transient(parent)  # type: ignore[arg-type]
         self.bind("<KeyPress-Escape>", self.dismiss)
+        # route window-manager close through dismiss so a kept-alive
+        # box still releases its wait_variable loop
+        self.protocol("WM_DELETE_WINDOW", self.dismiss)
         self.create_widgets()
-        top = self.winfo_toplevel()
-        top.rowconfigure(0, weight=1)
-        top.columnconfigure(0, weight=1)
-        self.transient(parent)  # type: ignore[arg-type]
-        self.wm_withdraw()
+        # a Toplevel is its own toplevel; configure it directly
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
 
     def show(self) -> ButtonName:
         """
         Show the constructed message box as a modal dialog.
 
+        When `modal` is False, the message box is displayed and control
+        returns immediately with `ButtonName.NONE`; the event loop keeps
+        running while the notification stays up.
+
         Returns
         -------
         ButtonName - the ButtonName of the button pressed.
         """
         self.wm_deiconify()
+        if not self.modal:
+            return self.result
         self.wait_visibility()
         self.grab_set()
-        self.wait_window()
+        if self.keep_alive:
+            self._done.set(0)
+            self.wait_variable(self._done)
+        else:
+            self.wait_window()
         return self.result
 
+    def reshow(
+        self, parent: tk.Misc | None = None, *,
+        title: str | None = None, message: str | None = None
+    ) -> ButtonName:
+        """
+        Reconfigure a kept-alive message box and show it again.
+
+        Parameters
+        ----------
+        parent : Misc, optional
+            The parent widget.
+        title : str, optional
+            The title to display in the window title bar.
+        message : str, optional
+            The message text of the messagebox.
+
+        Returns
+        -------
+        ButtonName - the ButtonName of the button pressed.
+        """
+        self.result = ButtonName.NONE
+        if parent is not None:
+            self.transient(parent)  # type: ignore[call-overload]
+        self.title(title)
+        self.message = message
+        self._message_label.configure(text=message if message else "")
+        return self.show()
+
+    def dismiss(self, *_args) -> None:
+        """
+        Dismiss the message box, hiding kept-alive instances for reuse.
+        """
+        if not self.keep_alive:
+            super().dismiss()
+            return
+        self.grab_release()
+        self.wm_withdraw()
+        self._done.set(1)
+
     def create_widgets(self) -> None:
         """
         Create the widgets to be displayed in the message box.
         """
-        message = self.message if self.message else ""
-        label = ttk.Label(
-            self.internal_frame, text=message, compound=tk.LEFT, wraplength=320
-        )
+        options: dict = {"text": self.message if self.message else "", "wraplength": 320}
         if self.custom_icon is not None:
-            label.configure(image=self.custom_icon)
+            # compound only matters when an image accompanies the text
+            options["image"] = self.custom_icon
+            options["compound"] = tk.LEFT
+        label = ttk.Label(self.internal_frame, **options)
         label.grid(row=0, column=0, sticky=tk.NSEW, padx=INTERNAL_PAD, pady=INTERNAL_PAD)
+        self._message_label = label
         if self.button_list is not None:
-            with suppress(KeyError):
-                buttons = [self.button_definitions[button] for button in self.button_list]
+            definitions = self.button_definitions
+            buttons = [
+                definition for definition in map(definitions.get, self.button_list)
+                if definition is not None
+            ]
+            if buttons:
                 self.add_buttons(self.internal_frame, buttons=buttons, default=self.default)
         else:
             self.add_buttons_from_button_set()()
 
     def _set_standard_icon(self) -> None:
-        if self.custom_icon is not None:
+        if self.custom_icon is not None or self.icon is None:
             return
-        file: str | None = None
-        if self.icon is not None:
-            with suppress(KeyError):
-                file = MESSAGE_BOX_ICON_PATHS[self.icon]
-        if file is not None:
-            self.custom_icon = tk.PhotoImage(file=get_full_path(file))
+        if self.icon in MESSAGE_BOX_ICON_PATHS:
+            self.custom_icon = _load_icon(self.icon)
 
     def add_buttons_from_button_set(self) -> Callable:
         """
@@ -189,73 +283,51 @@ class MessageBox(ButtonMixin, tk.Toplevel):
         -------
         Callable - a method which adds one or more buttons to the message box.
         """
-        button_set_command = {
-            MessageBoxButtonSet.OK: self.add_ok_button,
-            MessageBoxButtonSet.OKCANCEL: self.add_ok_cancel_buttons,
-            MessageBoxButtonSet.CLOSE: self.add_close_button,
-            MessageBoxButtonSet.YESNO: self.add_yes_no_buttons,
-            MessageBoxButtonSet.YESNOCANCEL: self.add_yes_no_cancel_buttons,
-            MessageBoxButtonSet.RETRYCANCEL: self.add_retry_cancel_buttons
-        }
-        with suppress(KeyError):
-            return button_set_command[self.button_set]
+        method_name = _BUTTON_SET_METHODS.get(self.button_set)
+        if method_name is not None:
+            return getattr(self, method_name)
         return lambda: None
 
+    def _add_named_buttons(self, names: tuple[ButtonName, ...], default: int) -> None:
+        """
+        Add the buttons in `names` to the bottom row of the modal dialog.
+        """
+        defs = self.button_definitions
+        buttons = [defs[name] for name in names]
+        self.add_buttons(self.internal_frame, buttons=buttons, default=default)
+
     def add_ok_button(self) -> None:
         """
         Add an OK button to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.OK]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=0)
+        self._add_named_buttons(self._OK_BUTTONS, default=0)
 
     def add_ok_cancel_buttons(self) -> None:
         """
         Add OK and Cancel buttons to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.CANCEL],
-            self.button_definitions[ButtonName.OK]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=1)
+        self._add_named_buttons(self._OK_CANCEL_BUTTONS, default=1)
 
     def add_close_button(self) -> None:
         """
         Add a Close button to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.CLOSE]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=0)
+        self._add_named_buttons(self._CLOSE_BUTTONS, default=0)
 
     def add_yes_no_buttons(self) -> None:
         """
         Add Yes and No buttons to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.NO],
-            self.button_definitions[ButtonName.YES]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=1)
+        self._add_named_buttons(self._YES_NO_BUTTONS, default=1)
 
     def add_yes_no_cancel_buttons(self) -> None:
         """
-        Add OK and Cancel buttons to the bottom row of the modal dialog.
+        Add Yes, No, and Cancel buttons to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.CANCEL],
-            self.button_definitions[ButtonName.NO],
-            self.button_definitions[ButtonName.YES]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=2)
+        self._add_named_buttons(self._YES_NO_CANCEL_BUTTONS, default=2)
 
     def add_retry_cancel_buttons(self) -> None:
         """
         Add Retry and Cancel buttons to the bottom row of the modal dialog.
         """
-        buttons = [
-            self.button_definitions[ButtonName.CANCEL],
-            self.button_definitions[ButtonName.RETRY]
-        ]
-        self.add_buttons(self.internal_frame, buttons=buttons, default=1)
+        self._add_named_buttons(self._RETRY_CANCEL_BUTTONS, default=1)
@@ -7,6 +7,7 @@ Themed message boxes.
 
 from __future__ import annotations
 
+from tkinter import TclError
 from typing import TYPE_CHECKING
 
 from .base import MessageBox, MessageBoxButtonSet, MessageBoxIcon
@@ -16,72 +17,114 @@ if TYPE_CHECKING:
 
     from ...widgets.buttons import ButtonName
 
+_MB_POOL: dict[tuple[MessageBoxIcon, MessageBoxButtonSet], MessageBox] = {}
 
-def show_message(parent: Misc | None, title: str, message: str) -> ButtonName:
+
+def _pooled_messagebox(
+    icon: MessageBoxIcon, button_set: MessageBoxButtonSet
+) -> MessageBox:
+    """
+    Get the shared message box for an icon/button-set combination.
+
+    Constructing a Toplevel per call is the dominant cost of showing a
+    message box, so one hidden instance per combination is kept and
+    reconfigured on each use.
+    """
+    key = (icon, button_set)
+    box = _MB_POOL.get(key)
+    if box is not None:
+        try:
+            if box.winfo_exists():
+                return box
+        except TclError:
+            # the box belonged to an interpreter destroyed by a restart
+            pass
+    box = MessageBox(icon=icon, button_set=button_set, keep_alive=True)
+    _MB_POOL[key] = box
+    return box
+
+
+def _show(
+    parent: Misc | None, title: str, message: str,
+    icon: MessageBoxIcon, button_set: MessageBoxButtonSet, *,
+    modal: bool = True
+) -> ButtonName:
+    """
+    Show the pooled message box for the given icon and button set.
+    """
+    box = _pooled_messagebox(icon, button_set)
+    box.modal = modal
+    return box.reshow(parent, title=title, message=message)
+
+
+def show_message(
+    parent: Misc | None, title: str, message: str, *, async_: bool = False
+) -> ButtonName:
     """
     Display a message box to show a message.
+
+    When `async_` is True, return immediately instead of waiting for the
+    message box to be acknowledged.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.QUESTION,
-        button_set=MessageBoxButtonSet.OK
-    ).show()
+    return _show(
+        parent, title, message, MessageBoxIcon.QUESTION, MessageBoxButtonSet.OK,
+        modal=not async_
+    )
 
 
-def show_warning(parent: Misc | None, title: str, message: str) -> ButtonName:
+def show_warning(
+    parent: Misc | None, title: str, message: str, *, async_: bool = False
+) -> ButtonName:
     """
     Display a message box to show a warning.
+
+    When `async_` is True, return immediately instead of waiting for the
+    message box to be acknowledged.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.WARNING,
-        button_set=MessageBoxButtonSet.OK
-    ).show()
+    return _show(
+        parent, title, message, MessageBoxIcon.WARNING, MessageBoxButtonSet.OK,
+        modal=not async_
+    )
 
 
-def show_error(parent: Misc | None, title: str, message: str) -> ButtonName:
+def show_error(
+    parent: Misc | None, title: str, message: str, *, async_: bool = False
+) -> ButtonName:
     """
     Display a message box to show an error.
+
+    When `async_` is True, return immediately instead of waiting for the
+    message box to be acknowledged.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.ERROR,
-        button_set=MessageBoxButtonSet.OK
-    ).show()
+    return _show(
+        parent, title, message, MessageBoxIcon.ERROR, MessageBoxButtonSet.OK,
+        modal=not async_
+    )
 
 
 def ask_ok_cancel(parent: Misc | None, title: str, message: str) -> ButtonName:
     """
     Display a message box to ask a question with OK/Cancel buttons.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.QUESTION,
-        button_set=MessageBoxButtonSet.OKCANCEL
-    ).show()
+    return _show(parent, title, message, MessageBoxIcon.QUESTION, MessageBoxButtonSet.OKCANCEL)
 
 
 def ask_yes_no(parent: Misc | None, title: str, message: str) -> ButtonName:
     """
     Display a message box to ask a question with Yes/No buttons.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.QUESTION,
-        button_set=MessageBoxButtonSet.YESNO
-    ).show()
+    return _show(parent, title, message, MessageBoxIcon.QUESTION, MessageBoxButtonSet.YESNO)
 
 
 def ask_yes_no_cancel(parent: Misc | None, title: str, message: str) -> ButtonName:
     """
     Display a message box to ask a question with Yes/No/Cancel buttons.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.QUESTION,
-        button_set=MessageBoxButtonSet.YESNOCANCEL
-    ).show()
+    return _show(parent, title, message, MessageBoxIcon.QUESTION, MessageBoxButtonSet.YESNOCANCEL)
 
 
 def ask_retry_cancel(parent: Misc | None, title: str, message: str) -> ButtonName:
     """
     Display a message box to ask a question with Retry/Cancel buttons.
     """
-    return MessageBox(
-        parent, title=title, message=message, icon=MessageBoxIcon.QUESTION,
-        button_set=MessageBoxButtonSet.RETRYCANCEL
-    ).show()
+    return _show(parent, title, message, MessageBoxIcon.QUESTION, MessageBoxButtonSet.RETRYCANCEL)
@@ -9,9 +9,9 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from .. import _common, desktop_menu
+from .. import _common
 from ..app_locale import LANGUAGES, get_translator
 from ..widgets import DropDown
 from ._base_modal import ModalDialog
@@ -27,12 +27,32 @@ _ = get_translator()
 # These lint errors don't make sense for GUI widgets, so are disabled here.
 # pragma pylint: disable=too-many-instance-attributes
 
-THEMES = {
-    _("Light"): "Light",
-    _("Dark"): "Dark",
-    _("Same as System"): "Same as System"
-}
-"""The translated names of the application themes."""
+def _themes() -> dict[str, str]:
+    """
+    Build the translated names of the application themes.
+
+    Built on demand so the names use the translator active when the
+    dialog is opened, not the one active when the module was imported.
+    """
+    return {
+        _("Light"): "Light",
+        _("Dark"): "Dark",
+        _("Same as System"): "Same as System"
+    }
+
+
+_GRID_PAD: dict[str, Any] = {"padx": _common.INTERNAL_PAD, "pady": _common.INTERNAL_PAD}
+"""Shared grid padding options, built once instead of per `grid` call."""
+
+_BOX_GRID_PAD: dict[str, Any] = {"pady": _common.INTERNAL_PAD, "padx": (0, _common.INTERNAL_PAD)}
+"""Shared grid padding options for the dropdown boxes."""
+
+
+def _clear_selection(event: tk.Event) -> None:
+    """
+    Clear the visual selection of a combobox after the user picks a value.
+    """
+    event.widget.selection_clear()
 
 
 class SettingsDialog(ModalDialog):
@@ -87,6 +107,8 @@ class SettingsDialog(ModalDialog):
             "regular": self.settings.regular_font.get_full_font().get_string(),
             "fixed": self.settings.fixed_font.get_full_font().get_string()
         }
+        # tracks the latest chosen font strings so they are serialized once
+        self._current_fonts = dict(self.fonts)
         super().__init__(parent, title=title, iconpath=iconpath)
 
     def update_screen(self) -> None:
@@ -99,77 +121,56 @@ class SettingsDialog(ModalDialog):
     def create_widgets(self) -> None:
         """
         Create the widgets to be displayed in the modal dialog.
+
+        The labelled rows are driven by a small table so one loop issues
+        the label and field construction for all of them.
         """
         for row in range(1, 7):
             self.internal_frame.rowconfigure(row, weight=1)
         self.internal_frame.columnconfigure(2, weight=1)
-        ttk.Label(
-            self.internal_frame, text=_("Language"), font=self.base_font
-        ).grid(row=1, column=1, sticky=tk.E, padx=_common.INTERNAL_PAD)
         self.langbox = DropDown(
             self.internal_frame, dictionary=LANGUAGES, state=["readonly"],
             exportselection=0, font=self.base_font
         )
         self.langbox.set(self.settings.language)
-        self.langbox.grid(
-            row=1, column=2, sticky=tk.EW, pady=_common.INTERNAL_PAD,
-            padx=(0, _common.INTERNAL_PAD)
-        )
-        self.langbox.bind(
-            "<<ComboboxSelected>>", lambda event: event.widget.selection_clear()
-        )
-        ttk.Label(
-            self.internal_frame, text=_("Theme"), font=self.base_font
-        ).grid(row=2, column=1, sticky=tk.E, padx=_common.INTERNAL_PAD)
         # Language translation is used as keys, and English is used as values
         # so that English is stored in the settings file, while allowing the
         # user to choose their theme based on their selected language.
         self.themebox = DropDown(
-            self.internal_frame, dictionary=THEMES, state=["readonly"],
+            self.internal_frame, dictionary=_themes(), state=["readonly"],
             exportselection=0, font=self.base_font
         )
         self.themebox.set(self.settings.theme)
-        self.themebox.grid(
-            row=2, column=2, sticky=tk.EW, pady=_common.INTERNAL_PAD,
-            padx=(0, _common.INTERNAL_PAD)
-        )
-        self.themebox.bind(
-            "<<ComboboxSelected>>", lambda event: event.widget.selection_clear()
-        )
-        ttk.Checkbutton(
-            self.internal_frame, text=_("Always on top"), variable=self.always_on_top,
-            style="Switch.TCheckbutton"
-        ).grid(
-            row=3, column=2, sticky=tk.EW, padx=_common.INTERNAL_PAD,
-            pady=_common.INTERNAL_PAD
-        )
-        ttk.Label(
-            self.internal_frame, text=_("Regular Font"), font=self.base_font
-        ).grid(row=4, column=1, sticky=tk.E, padx=_common.INTERNAL_PAD)
         self.font_button = ttk.Button(
-            self.internal_frame, text=self.fonts["regular"], command=self.show_font_chooser
-        )
-        self.font_button.grid(
-            row=4, column=2, sticky=tk.EW, padx=_common.INTERNAL_PAD,
-            pady=_common.INTERNAL_PAD
+            self.internal_frame, text=self.fonts["regular"],
+            command=self.show_font_chooser
         )
-        ttk.Label(
-            self.internal_frame, text=_("Monospace Font"), font=self.base_font
-        ).grid(row=5, column=1, sticky=tk.E, padx=_common.INTERNAL_PAD)
         self.fixed_font_button = ttk.Button(
-            self.internal_frame, text=self.fonts["fixed"], command=self.show_fixedfont_chooser
+            self.internal_frame, text=self.fonts["fixed"],
+            command=self.show_fixedfont_chooser
         )
-        self.fixed_font_button.grid(
-            row=5, column=2, sticky=tk.EW, padx=_common.INTERNAL_PAD,
-            pady=_common.INTERNAL_PAD
+        rows = (
+            (1, _("Language"), self.langbox, _BOX_GRID_PAD),
+            (2, _("Theme"), self.themebox, _BOX_GRID_PAD),
+            (4, _("Regular Font"), self.font_button, _GRID_PAD),
+            (5, _("Monospace Font"), self.fixed_font_button, _GRID_PAD)
         )
+        for row, text, widget, grid_options in rows:
+            ttk.Label(
+                self.internal_frame, text=text, font=self.base_font
+            ).grid(row=row, column=1, sticky=tk.E, padx=_common.INTERNAL_PAD)
+            widget.grid(row=row, column=2, sticky=tk.EW, **grid_options)
+        # add="+" keeps DropDown's own selection-caching binding intact
+        self.langbox.bind("<<ComboboxSelected>>", _clear_selection, add="+")
+        self.themebox.bind("<<ComboboxSelected>>", _clear_selection, add="+")
+        ttk.Checkbutton(
+            self.internal_frame, text=_("Always on top"), variable=self.always_on_top,
+            style="Switch.TCheckbutton"
+        ).grid(row=3, column=2, sticky=tk.EW, **_GRID_PAD)
         ttk.Checkbutton(
             self.internal_frame, text=_("Add to desktop menu system"),
             variable=self.add_menu_icon, style="Switch.TCheckbutton",
-        ).grid(
-            row=6, column=1, columnspan=2, sticky=tk.NS+tk.E, padx=_common.INTERNAL_PAD,
-            pady=_common.INTERNAL_PAD
-        )
+        ).grid(row=6, column=1, columnspan=2, sticky=tk.NS+tk.E, **_GRID_PAD)
         self.add_ok_cancel_buttons()
         self.add_sizegrip()
 
@@ -184,9 +185,8 @@ class SettingsDialog(ModalDialog):
         chosen_font = chooser.get_font()
         if chosen_font:
             self.settings.regular_font.set_full_font(chosen_font)
-            self.font_button.config(
-                text=self.settings.regular_font.get_full_font().get_string()
-            )
+            self._current_fonts["regular"] = chosen_font.get_string()
+            self.font_button.config(text=self._current_fonts["regular"])
         else:
             self.font_button.config(
                 text=_("Select a font")
@@ -203,9 +203,8 @@ class SettingsDialog(ModalDialog):
         chosen_font = chooser.get_font()
         if chosen_font:
             self.settings.fixed_font.set_full_font(chosen_font)
-            self.fixed_font_button.config(
-                text=self.settings.fixed_font.get_full_font().get_string()
-            )
+            self._current_fonts["fixed"] = chosen_font.get_string()
+            self.fixed_font_button.config(text=self._current_fonts["fixed"])
         else:
             self.font_button.config(
                 text=_("Select a font")
@@ -223,6 +222,8 @@ class SettingsDialog(ModalDialog):
         """
         Update the app settings.
         """
+        # imported here so the app cold-start doesn't pay for desktop_menu
+        from .. import desktop_menu  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         self.settings.language = self.langbox.get()
         self.settings.theme = self.themebox.get()
         self.settings.always_on_top = self.always_on_top.get()
@@ -240,10 +241,8 @@ class SettingsDialog(ModalDialog):
         """
         if old_language != self.langbox.get():
             self.save_dismiss_event("<<LanguageChanged>>")
-        new_regular_font = self.settings.regular_font.get_full_font().get_string()
-        new_fixed_font = self.settings.fixed_font.get_full_font().get_string()
-        if self.fonts["regular"] != new_regular_font:
+        if self.fonts["regular"] != self._current_fonts["regular"]:
             self.save_dismiss_event("<<FontChanged>>")
-        if self.fonts["fixed"] != new_fixed_font:
+        if self.fonts["fixed"] != self._current_fonts["fixed"]:
             self.save_dismiss_event("<<FontChanged>>")
         self.save_dismiss_event("<<SettingsChanged>>")
@@ -7,9 +7,13 @@ CPU usage details modal dialog.
 
 from __future__ import annotations
 
+import threading
 import tkinter as tk
+from itertools import groupby
+from pathlib import Path
+from queue import Empty, Queue
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import psutil
 
@@ -18,16 +22,209 @@ from ..app_locale import get_translator
 from ._base_modal import ModalDialog
 
 if TYPE_CHECKING:
+    from tkinter import Misc
+
     from psutil._common import shwtemp
 
 _ = get_translator()
 
+_ENTRY_TEMPLATE = _("{current}°C (high = {high}°C, critical = {critical}°C)")
+"""Pre-translated reading template; the module is reloaded on language change."""
+
+_GRID_PADX: dict[str, Any] = {"padx": _common.INTERNAL_PAD}
+"""Shared grid padding options, built once instead of per `grid` call."""
+
+_GRID_PAD: dict[str, Any] = {"padx": _common.INTERNAL_PAD, "pady": _common.INTERNAL_PAD}
+"""Shared grid padding options for the group separators."""
+
+_HWMON_DIR = Path("/sys/class/hwmon")
+"""The sysfs directory holding the hardware monitoring sensors on Linux."""
+
+_INPUT_GLOB = "hwmon*/temp*_input"
+"""Glob pattern matching the temperature input files under `_HWMON_DIR`."""
+
+_RESCAN_TICKS = 40
+"""How many fast-path polls to run between checks for hotplugged sensors."""
+
 
 class TempDetailsDialog(ModalDialog):
     """
     Display detailed temperature readings in a modal dialog.
     """
 
+    def __init__(
+        self, parent: Misc | None = None, *, title: str | None = None,
+        iconpath: str | None = None
+    ) -> None:
+        """
+        Construct a modal dialog containing detailed temperature readings.
+
+        Parameters
+        ----------
+        parent : Misc, optional
+            The parent widget.
+        title : str, optional
+            The title to display in the window title bar.
+        iconpath : str, optional
+            The path to the icon to display in the window title bar.
+        """
+        self._temps_queue: Queue[list[tuple[str, str, str]]] = Queue(maxsize=1)
+        self._stop_polling = threading.Event()
+        self._visible = threading.Event()
+        self._visible.set()
+        self._update_job: str | None = None
+        threading.Thread(target=self._poll_sensors, daemon=True).start()
+        super().__init__(parent, title=title, iconpath=iconpath)
+
+    def _poll_sensors(self) -> None:
+        """
+        Poll the temperature sensors from a background thread.
+
+        Only the current reading of a sensor changes between refreshes, so
+        on Linux the poller reads just the sysfs `temp*_input` files after
+        discovering the sensor layout once, instead of letting psutil
+        rebuild its full dict of namedtuples every tick. Any surprise
+        (non-Linux platform, unreadable file, layout mismatch) drops back
+        to `psutil.sensors_temperatures` permanently.
+
+        Every `_RESCAN_TICKS` fast-path polls, the sysfs file set is
+        re-globbed so hotplugged or removed sensors are picked up and a
+        fresh layout is discovered.
+        """
+        temps = psutil.sensors_temperatures()
+        self._meta = self._sensor_meta(temps)
+        self._input_paths = self._discover_input_paths(temps)
+        ticks = 0
+        while not self._stop_polling.is_set():
+            ticks = self._maybe_rescan(ticks + 1)
+            self._publish(self._poll_rows())
+            # poll at a quarter of the rate while the dialog is not visible
+            factor = 1 if self._visible.is_set() else 4
+            self._stop_polling.wait(factor * _common.REFRESH_INTERVAL / 1000)
+
+    def _maybe_rescan(self, ticks: int) -> int:
+        """
+        Re-glob the sysfs layout every `_RESCAN_TICKS` fast-path polls.
+
+        Parameters
+        ----------
+        ticks : int
+            The number of fast-path polls since the last rescan.
+
+        Returns
+        -------
+        int - the tick count to carry into the next poll.
+        """
+        if self._input_paths is None or ticks < _RESCAN_TICKS:
+            return ticks
+        if set(_HWMON_DIR.glob(_INPUT_GLOB)) != set(self._input_paths):
+            # the sensor layout changed; rediscover it
+            temps = psutil.sensors_temperatures()
+            self._meta = self._sensor_meta(temps)
+            self._input_paths = self._discover_input_paths(temps)
+        return 0
+
+    def _poll_rows(self) -> list[tuple[str, str, str]]:
+        """
+        Build one (unit, label, text) snapshot of the sensor readings.
+
+        Takes the sysfs fast path while it keeps working and drops to
+        psutil permanently on the first surprise.
+        """
+        if self._input_paths is not None:
+            rows = self._fast_rows()
+            if rows is not None:
+                return rows
+            self._input_paths = None
+        return self._rows_of(psutil.sensors_temperatures())
+
+    def _fast_rows(self) -> list[tuple[str, str, str]] | None:
+        """
+        Read the discovered sysfs input files directly.
+
+        Returns None when any file fails to read or parse, signalling
+        the caller to abandon the fast path.
+        """
+        assert self._input_paths is not None  # nosec B101
+        try:
+            return [
+                (name, label, _ENTRY_TEMPLATE.format(
+                    current=self._read_input(path), high=high, critical=critical
+                ))
+                for path, (name, label, high, critical)
+                in zip(self._input_paths, self._meta)
+            ]
+        except (OSError, ValueError):
+            return None
+
+    def _publish(self, rows: list[tuple[str, str, str]]) -> None:
+        """
+        Replace whatever snapshot is waiting in the queue with `rows`.
+        """
+        try:
+            while True:
+                self._temps_queue.get_nowait()
+        except Empty:
+            pass
+        self._temps_queue.put(rows)
+
+    @staticmethod
+    def _sensor_meta(
+        temps: dict[str, list[shwtemp]]
+    ) -> list[tuple[str, str, float, float]]:
+        """
+        Flatten the per-sensor (unit, label, high, critical) metadata.
+        """
+        return [
+            (name, entry.label or name, entry.high, entry.critical)
+            for name, entries in temps.items() for entry in entries
+        ]
+
+    @staticmethod
+    def _discover_input_paths(temps: dict[str, list[shwtemp]]) -> list[Path] | None:
+        """
+        Map the sensors reported by psutil to their sysfs `temp*_input` files.
+
+        Returns None when the layout cannot be matched confidently, in
+        which case the poller keeps using psutil directly.
+
+        Parameters
+        ----------
+        temps : dict[str, list[shwtemp]]
+            The sensor readings used to validate the discovered layout.
+
+        Returns
+        -------
+        list[Path] | None - the input file for each sensor, flattened in the
+        same order psutil reports them.
+        """
+        inputs = list(_HWMON_DIR.glob(_INPUT_GLOB))
+        if not inputs:
+            return None
+        grouped: dict[str, list[Path]] = {}
+        try:
+            for path in sorted(inputs):
+                unit = (path.parent / "name").read_text(encoding="utf-8").strip()
+                grouped.setdefault(unit, []).append(path)
+        except OSError:
+            return None
+        if {name: len(paths) for name, paths in grouped.items()} != {
+            name: len(entries) for name, entries in temps.items()
+        }:
+            return None
+        return [path for name in temps for path in grouped[name]]
+
+    @staticmethod
+    def _read_input(path: Path) -> float:
+        """
+        Read one sysfs temperature input file, reported in millidegrees.
+        """
+        return int(path.read_text(encoding="utf-8")) / 1000.0
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self:
+            self._stop_polling.set()
+
     def on_save(self) -> None:
         """
         Save what was entered in the modal dialog.
@@ -35,71 +232,143 @@ class TempDetailsDialog(ModalDialog):
         This dialog does not need a save feature.
         """
 
-    def create_widgets(self) -> None:
+    def create_widgets(self, rows: list[tuple[str, str, str]] | None = None) -> None:
         """
         Create the widgets to be displayed in the modal dialog.
+
+        Parameters
+        ----------
+        rows : list[tuple[str, str, str]], optional
+            A prebuilt (unit, label, text) snapshot to use instead of
+            re-reading the sensors.
         """
+        if rows is None:
+            rows = self._rows_of(psutil.sensors_temperatures())
+        self._schema = tuple(row[:2] for row in rows)
         self.internal_frame.columnconfigure(0, weight=1)
-        self._readings: list[list[tk.StringVar]] = []
-        ttk.Label(
+        self._value_labels: list[ttk.Label] = []
+        self._last_strings: list[str] = []
+        self._title_label = ttk.Label(
             self.internal_frame, text=_("Temperature Sensors"), font=self.large_font,
             anchor=tk.CENTER
-        ).grid(columnspan=2, sticky=tk.NSEW, pady=(_common.INTERNAL_PAD, 0))
-        temps = psutil.sensors_temperatures()
-        stretchy_rows = self._create_detail_widgets(temps, 1)
+        )
+        self._title_label.grid(
+            columnspan=2, sticky=tk.NSEW, pady=(_common.INTERNAL_PAD, 0)
+        )
+        stretchy_rows = self._create_detail_widgets(rows, 1)
         for i in stretchy_rows:
             self.internal_frame.rowconfigure(i, weight=1)
         self.add_close_button()
         self.add_sizegrip()
+        self.bind("<Destroy>", self._on_destroy)
+        self.bind("<<LanguageChanged>>", self._update_language)
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Map>", self._on_map)
+
+    def _on_unmap(self, event: tk.Event) -> None:
+        # pause the refresh timer while the dialog is iconified or hidden
+        if event.widget is self:
+            self._visible.clear()
+            if self._update_job is not None:
+                self.after_cancel(self._update_job)
+                self._update_job = None
+
+    def _on_map(self, event: tk.Event) -> None:
+        if event.widget is self and not self._visible.is_set():
+            self._visible.set()
+            self.update_screen()
+
+    def _update_language(self, *_args) -> None:
+        """
+        Refresh the translated chrome in place.
+
+        Only the title text is translated; the sensor labels and value
+        widgets are left alone, avoiding a full widget-tree rebuild.
+        """
+        self._title_label.configure(text=_("Temperature Sensors"))
 
     def _create_detail_widgets(
-        self, temps: dict[str, list[shwtemp]], start_row: int
+        self, rows: list[tuple[str, str, str]], start_row: int
     ) -> list[int]:
         row = start_row
         stretchy_rows: list[int] = []
-        for name, entries in temps.items():
+        for name, group in groupby(rows, key=lambda item: item[0]):
             ttk.Label(
                 self.internal_frame, text=name.upper(), anchor=tk.SW, font=self.bold_font
-            ).grid(
-                column=0, row=row, sticky=tk.NSEW, padx=_common.INTERNAL_PAD,
-                columnspan=2
-            )
+            ).grid(column=0, row=row, sticky=tk.NSEW, columnspan=2, **_GRID_PADX)
             stretchy_rows.append(row)
             row += 1
-            entryreadings: list[tk.StringVar] = []
-            for count, entry in enumerate(entries):
-                entryreadings.append(tk.StringVar())
-                entryreadings[count].set(self._format_entry(entry))
+            for _name, label, text in group:
+                self._last_strings.append(text)
                 ttk.Label(
-                    self.internal_frame, text=entry.label or name, anchor=tk.W,
+                    self.internal_frame, text=label, anchor=tk.W,
                     font=self.base_font
                 ).grid(column=0, row=row, padx=_common.INTERNAL_PAD*2, sticky=tk.NSEW)
-                ttk.Label(
-                    self.internal_frame, textvariable=entryreadings[count], anchor=tk.W,
+                value_label = ttk.Label(
+                    self.internal_frame, text=text, anchor=tk.W,
                     font=self.base_font
-                ).grid(column=1, row=row, padx=_common.INTERNAL_PAD, sticky=tk.NSEW)
+                )
+                value_label.grid(column=1, row=row, sticky=tk.NSEW, **_GRID_PADX)
+                self._value_labels.append(value_label)
                 stretchy_rows.append(row)
                 row += 1
-            self._readings.append(entryreadings)
             ttk.Separator(self.internal_frame, orient=tk.HORIZONTAL).grid(
-                column=0, columnspan=2, row=row, sticky=tk.NSEW,
-                padx=_common.INTERNAL_PAD, pady=_common.INTERNAL_PAD
+                column=0, columnspan=2, row=row, sticky=tk.NSEW, **_GRID_PAD
             )
             row += 1
         return stretchy_rows
 
+    def reset(self, rows: list[tuple[str, str, str]] | None = None) -> None:
+        """
+        Rebuild the dialog after the sensor layout changed.
+
+        Parameters
+        ----------
+        rows : list[tuple[str, str, str]], optional
+            A prebuilt (unit, label, text) snapshot to use instead of
+            re-reading the sensors.
+        """
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+        for child in self.internal_frame.winfo_children():
+            child.destroy()
+        self.create_widgets(rows)
+        self.update_screen()
+
     def update_screen(self) -> None:
         """
         Update the modal dialog window.
         """
-        temps = psutil.sensors_temperatures()
-        for row, entries in enumerate(temps.values()):
-            for count, entry in enumerate(entries):
-                self._readings[row][count].set(self._format_entry(entry))
-        self.after(_common.REFRESH_INTERVAL, self.update_screen)
+        try:
+            rows = self._temps_queue.get_nowait()
+        except Empty:
+            # no fresh reading from the poller yet; just re-arm the timer
+            self._update_job = self.after(_common.REFRESH_INTERVAL, self.update_screen)
+            return
+        if tuple(row[:2] for row in rows) != self._schema:
+            # a sensor appeared or vanished; rebuild the widget tree once
+            self.reset(rows)
+            return
+        for idx, (_name, _label, text) in enumerate(rows):
+            # skip the Tcl round-trip when the reading is unchanged
+            if text != self._last_strings[idx]:
+                self._last_strings[idx] = text
+                self._value_labels[idx].configure(text=text)
+        self._update_job = self.after(_common.REFRESH_INTERVAL, self.update_screen)
+
+    @classmethod
+    def _rows_of(cls, temps: dict[str, list[shwtemp]]) -> list[tuple[str, str, str]]:
+        """
+        Flatten psutil sensor readings into (unit, label, text) rows.
+        """
+        return [
+            (name, entry.label or name, cls._format_entry(entry))
+            for name, entries in temps.items() for entry in entries
+        ]
 
     @classmethod
     def _format_entry(cls, entry: shwtemp) -> str:
-        return _("{current}°C (high = {high}°C, critical = {critical}°C)").format(
+        return _ENTRY_TEMPLATE.format(
             current=entry.current, high=entry.high, critical=entry.critical
         )
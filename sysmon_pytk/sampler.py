@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: © 2024 Stacey Adams <stacey.belle.rose@gmail.com>
+# SPDX-License-Identifier: MIT
+
+"""
+Shared system-metric sampler.
+
+Each meter widget refreshes on the same cadence, so without sharing,
+N widgets showing the same source mean N statvfs/procfs/sysfs reads
+per tick. The module-level `SAMPLER` polls each source at most once
+per tick and hands the cached reading to every caller in between.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+import psutil
+
+from ._common import REFRESH_INTERVAL, cpu_temp
+
+_TTL = REFRESH_INTERVAL / 2000
+"""Seconds a sample stays fresh: half a refresh tick, so every tick
+re-polls but same-tick readers share one sample."""
+
+
+class SysSampler:
+    """
+    Poll system metrics at most once per refresh tick.
+
+    Readings are pulled lazily, so sources nothing displays are never
+    polled. Tk callbacks all run on one thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """
+        Construct a sampler with no cached readings.
+        """
+        self._values: dict[tuple, Any] = {}
+        self._stamps: dict[tuple, float] = {}
+        self._temp_thread: threading.Thread | None = None
+        self._temp_reading = 0.0
+
+    def _sample(self, key: tuple, fetch: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """
+        Return the cached reading for a source, re-polling when stale.
+
+        Parameters
+        ----------
+        key : tuple
+            Which source the reading belongs to.
+        fetch : Callable
+            Polls the source for a fresh reading.
+        """
+        now = time.monotonic()
+        if now - self._stamps.get(key, 0.0) >= _TTL:
+            self._values[key] = fetch()
+            self._stamps[key] = now
+        return self._values[key]
+
+    def cpu_percent(self) -> float:
+        """
+        Get the system-wide CPU usage percentage.
+
+        Derived from the per-core sample, so the overall meter and the
+        per-CPU dialog share one /proc/stat read per tick.
+        """
+        per_cpu = self.cpu_percent_percpu()
+        return sum(per_cpu) / len(per_cpu)
+
+    def cpu_percent_percpu(self) -> list[float]:
+        """
+        Get the per-core CPU usage percentages.
+        """
+        return self._sample(
+            ("cpu", "percpu"),
+            lambda: psutil.cpu_percent(interval=None, percpu=True)
+        )
+
+    def memory_percent(self) -> float:
+        """
+        Get the virtual memory usage percentage.
+        """
+        return self._sample(("vmem",), lambda: psutil.virtual_memory().percent)
+
+    def disk_percent(self, mountpoint: str = "/") -> float:
+        """
+        Get the disk usage percentage of a mount point.
+
+        Parameters
+        ----------
+        mountpoint : str
+            A filesystem path belonging to the desired mount point.
+        """
+        return self._sample(
+            ("disk", mountpoint), lambda: psutil.disk_usage(mountpoint).percent
+        )
+
+    def temperature(self) -> float:
+        """
+        Get the CPU temperature in degrees Celsius.
+
+        Readings come from a background thread, so a sensor that is
+        slow to answer (ACPI wakeups can block for tens of
+        milliseconds) never stalls the Tk mainloop. Only the first call
+        samples synchronously, to seed the value and start the poller.
+        """
+        if self._temp_thread is None:
+            self._temp_reading = cpu_temp()
+            self._temp_thread = threading.Thread(
+                target=self._poll_temperature, daemon=True
+            )
+            self._temp_thread.start()
+        return self._temp_reading
+
+    def _poll_temperature(self) -> None:
+        """
+        Refresh the temperature reading once per tick, forever.
+
+        One writer here and one reader on the Tk thread exchanging a
+        single float attribute needs no lock under CPython.
+        """
+        while True:
+            time.sleep(REFRESH_INTERVAL / 1000)
+            try:
+                self._temp_reading = cpu_temp()
+            except OSError:
+                # keep showing the previous reading on a failed poll
+                continue
+
+
+SAMPLER = SysSampler()
+"""The sampler shared by all widgets."""
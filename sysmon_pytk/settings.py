@@ -7,10 +7,10 @@ Application settings.
 
 from __future__ import annotations
 
-from configparser import ConfigParser
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
+from .fast_config import FastConfigParser
 from .font_utils import MAIN_FONT_FAMILY, FontDescription, FontSlant, FontWeight
 
 if TYPE_CHECKING:
@@ -23,110 +23,165 @@ class FontSettings:  # pylint: disable=too-many-instance-attributes
 
     Attributes
     ----------
-    config : ConfigParser
+    config : FastConfigParser
         A configuration file parser.
     section : str
         Which section of the configuration file to use.
     """
 
-    def __init__(self, config: ConfigParser, section: str) -> None:
+    __slots__ = ("config", "section", "_section", "_cache", "_full_font", "_on_change")
+
+    def __init__(
+        self, config: FastConfigParser, section: str,
+        on_change: Callable[[], None] | None = None
+    ) -> None:
         """
         Construct a Font Settings manager.
 
         Parameters
         ----------
-        config : ConfigParser
+        config : FastConfigParser
             A configuration file parser.
         section : str
             Which section of the configuration file to use.
+        on_change : Callable, optional
+            Called whenever a setter changes a value, so the owner can
+            track unsaved changes.
         """
+        self._on_change = on_change
         self.config = config
         self.section = section
+        # resolved once; every getter otherwise re-indexes the parser
+        self._section = config[section]
+        # parsed values, so repeated reads skip ConfigParser string parsing
+        self._cache: dict[str, Any] = {}
+        # the assembled description, invalidated whenever a setter fires
+        self._full_font: FontDescription | None = None
 
     @property
     def name(self) -> str:
         """
         The font name to use in the application.
         """
-        return self.config[self.section].get("name", fallback=MAIN_FONT_FAMILY)
+        if "name" not in self._cache:
+            self._cache["name"] = self._section.get(
+                "name", fallback=MAIN_FONT_FAMILY
+            )
+        return self._cache["name"]
 
     @name.setter
     def name(self, fontname: str) -> None:
-        self.config[self.section]["name"] = fontname
+        self._section["name"] = fontname
+        self._cache["name"] = fontname
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     @property
     def size(self) -> int:
         """
         The font size to use in the application.
         """
-        return self.config[self.section].getint("size", fallback=12)
+        if "size" not in self._cache:
+            self._cache["size"] = self._section.getint("size", fallback=12)
+        return self._cache["size"]
 
     @size.setter
     def size(self, fontsize: int) -> None:
-        self.config[self.section]["size"] = f"{fontsize}"
+        self._section["size"] = str(fontsize)
+        self._cache["size"] = fontsize
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     @property
     def weight(self) -> FontWeight:
         """
         The font weight to use in the application.
         """
-        weight = self.config[self.section].get("weight", fallback="normal")
-        if weight == "bold":
-            return "bold"
-        return "normal"
+        if "weight" not in self._cache:
+            weight = self._section.get("weight", fallback="normal")
+            self._cache["weight"] = "bold" if weight == "bold" else "normal"
+        return self._cache["weight"]
 
     @weight.setter
     def weight(self, weight: str) -> None:
-        self.config[self.section]["weight"] = weight
+        self._section["weight"] = weight
+        self._cache["weight"] = "bold" if weight == "bold" else "normal"
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     @property
     def slant(self) -> FontSlant:
         """
         The font slant to use in the application.
         """
-        slant = self.config[self.section].get("slant", fallback="roman")
-        if slant == "italic":
-            return "italic"
-        return "roman"
+        if "slant" not in self._cache:
+            slant = self._section.get("slant", fallback="roman")
+            self._cache["slant"] = "italic" if slant == "italic" else "roman"
+        return self._cache["slant"]
 
     @slant.setter
     def slant(self, slant: str) -> None:
-        self.config[self.section]["slant"] = slant
+        self._section["slant"] = slant
+        self._cache["slant"] = "italic" if slant == "italic" else "roman"
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     @property
     def underline(self) -> bool:
         """
         The font underline flag to use in the application.
         """
-        return self.config[self.section].getboolean("underline", fallback=False)
+        if "underline" not in self._cache:
+            # new files store "1"/"0"; older ones may contain "True"/"False"
+            value = self._section.get("underline", fallback="0")
+            self._cache["underline"] = value in ("1", "True", "true")
+        return self._cache["underline"]
 
     @underline.setter
     def underline(self, underline: bool) -> None:
-        self.config[self.section]["underline"] = f"{underline}"
+        self._section["underline"] = "1" if underline else "0"
+        self._cache["underline"] = bool(underline)
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     @property
     def overstrike(self) -> bool:
         """
         The font overstrike flag to use in the application.
         """
-        return self.config[self.section].getboolean("overstrike", fallback=False)
+        if "overstrike" not in self._cache:
+            # new files store "1"/"0"; older ones may contain "True"/"False"
+            value = self._section.get("overstrike", fallback="0")
+            self._cache["overstrike"] = value in ("1", "True", "true")
+        return self._cache["overstrike"]
 
     @overstrike.setter
     def overstrike(self, overstrike: bool) -> None:
-        self.config[self.section]["overstrike"] = f"{overstrike}"
+        self._section["overstrike"] = "1" if overstrike else "0"
+        self._cache["overstrike"] = bool(overstrike)
+        self._full_font = None
+        if self._on_change is not None:
+            self._on_change()
 
     def get_full_font(self) -> FontDescription:
         """
         Get the full font specification to use in the application.
         """
-        return FontDescription(
-            family=self.name,
-            size=self.size,
-            weight=self.weight,
-            slant=self.slant,
-            underline=self.underline,
-            overstrike=self.overstrike
-        )
+        if self._full_font is None:
+            self._full_font = FontDescription(
+                family=self.name,
+                size=self.size,
+                weight=self.weight,
+                slant=self.slant,
+                underline=self.underline,
+                overstrike=self.overstrike
+            )
+        return self._full_font
 
     def set_full_font(self, font: FontDescription) -> None:
         """
@@ -138,18 +193,32 @@ class FontSettings:  # pylint: disable=too-many-instance-attributes
         self.slant = font.slant
         self.underline = font.underline
         self.overstrike = font.overstrike
+        self._full_font = font
 
     def configure_font(self, font: Font) -> None:
         """
         Configure an existing Font to use the current settings.
-        """
+
+        When the font already matches the settings — the common case on
+        restart — the Tk configure call is skipped entirely.
+        """
+        desc = self.get_full_font()
+        current = font.actual()
+        if (
+            current["family"], current["size"], current["weight"], current["slant"],
+            bool(current["underline"]), bool(current["overstrike"])
+        ) == (
+            desc.family, desc.size, desc.weight, desc.slant,
+            desc.underline, desc.overstrike
+        ):
+            return
         font.configure(
-            family=self.name,
-            size=self.size,
-            weight=self.weight,
-            slant=self.slant,
-            underline=self.underline,
-            overstrike=self.overstrike
+            family=desc.family,
+            size=desc.size,
+            weight=desc.weight,
+            slant=desc.slant,
+            underline=desc.underline,
+            overstrike=desc.overstrike
         )
 
 
@@ -161,7 +230,7 @@ class Settings:
     ----------
     filename : str
         The full path to the configuration file.
-    config : ConfigParser
+    config : FastConfigParser
         A configuration file parser.
     regular_font : FontSettings
         Font settings for the regular font.
@@ -169,6 +238,11 @@ class Settings:
         Font settings for the monospace font.
     """
 
+    __slots__ = (
+        "filename", "config", "_general", "_cache", "_dirty",
+        "regular_font", "fixed_font"
+    )
+
     def __init__(self, filename: str) -> None:
         """
         Construct a Settings manager.
@@ -179,70 +253,114 @@ class Settings:
             The full path to the configuration file.
         """
         self.filename = filename
-        self.config = ConfigParser()
+        self.config = FastConfigParser()
+        # parsed values, so repeated reads skip ConfigParser string parsing
+        self._cache: dict[str, Any] = {}
+        # unsaved changes flag, so clean write_settings calls skip the disk
+        self._dirty = False
         self.read_settings()
-        self.regular_font = FontSettings(self.config, "font")
-        self.fixed_font = FontSettings(self.config, "fixedfont")
+        self.regular_font = FontSettings(
+            self.config, "font", on_change=self._mark_dirty
+        )
+        self.fixed_font = FontSettings(
+            self.config, "fixedfont", on_change=self._mark_dirty
+        )
+
+    def _mark_dirty(self) -> None:
+        """
+        Record that a setting changed since the last write.
+        """
+        self._dirty = True
 
     def read_settings(self) -> None:
         """
         Read the settings from the configuration file.
         """
         self.config.read(self.filename)
+        self._cache.clear()
         if not self.config.has_section("general"):
             self.config.add_section("general")
         if not self.config.has_section("font"):
             self.config.add_section("font")
         if not self.config.has_section("fixedfont"):
             self.config.add_section("fixedfont")
+        # resolved once; every accessor otherwise re-indexes the parser
+        self._general = self.config["general"]
 
     def write_settings(self) -> None:
         """
         Write the settings to the configuration file.
+
+        Does nothing when no setting has changed since the last write.
         """
+        if not self._dirty:
+            return
         with Path(self.filename).open(mode="w", encoding="utf-8") as file:
             self.config.write(file)
+        self._dirty = False
 
     @property
     def theme(self) -> str:
         """
         The application theme.
         """
-        return self.config["general"].get("theme", fallback="Light")
+        if "theme" not in self._cache:
+            self._cache["theme"] = self._general.get("theme", fallback="Light")
+        return self._cache["theme"]
 
     @theme.setter
     def theme(self, theme: str) -> None:
-        self.config["general"]["theme"] = theme
+        self._general["theme"] = theme
+        self._cache["theme"] = theme
+        self._dirty = True
 
     @property
     def always_on_top(self) -> int:
         """
         The flag indicating whether the application should always be on top.
         """
-        return self.config["general"].getint("always_on_top", fallback=0)
+        if "always_on_top" not in self._cache:
+            self._cache["always_on_top"] = self._general.getint(
+                "always_on_top", fallback=0
+            )
+        return self._cache["always_on_top"]
 
     @always_on_top.setter
     def always_on_top(self, always_on_top: int) -> None:
-        self.config["general"]["always_on_top"] = f"{always_on_top}"
+        self._general["always_on_top"] = str(always_on_top)
+        self._cache["always_on_top"] = always_on_top
+        self._dirty = True
 
     @property
     def add_menu_icon(self) -> int:
         """
         The flag indicating whether the application should add a menu icon.
         """
-        return self.config["general"].getint("add_menu_icon", fallback=0)
+        if "add_menu_icon" not in self._cache:
+            self._cache["add_menu_icon"] = self._general.getint(
+                "add_menu_icon", fallback=0
+            )
+        return self._cache["add_menu_icon"]
 
     @add_menu_icon.setter
     def add_menu_icon(self, add_menu_icon: int) -> None:
-        self.config["general"]["add_menu_icon"] = f"{add_menu_icon}"
+        self._general["add_menu_icon"] = str(add_menu_icon)
+        self._cache["add_menu_icon"] = add_menu_icon
+        self._dirty = True
 
     @property
     def language(self) -> str:
         """
         The language to use.
         """
-        return self.config["general"].get("language", fallback="en")
+        if "language" not in self._cache:
+            self._cache["language"] = self._general.get(
+                "language", fallback="en"
+            )
+        return self._cache["language"]
 
     @language.setter
     def language(self, language: str) -> None:
-        self.config["general"]["language"] = language
+        self._general["language"] = language
+        self._cache["language"] = language
+        self._dirty = True
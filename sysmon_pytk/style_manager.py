@@ -7,12 +7,10 @@ Tk Style Manager.
 
 from __future__ import annotations
 
-import re
 import tkinter as tk
 from tkinter import font, ttk
-from typing import TYPE_CHECKING, TypeVar
-
-import darkdetect
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+from weakref import WeakKeyDictionary
 
 import azure
 
@@ -25,7 +23,7 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
-_DARK_CUTOFF_SQR = 127.5 * 127.5
+_DARK_CUTOFF_SCALED = int(127.5 * 127.5 * 1000)
 _LEN_HEXCOLOR = len("#FFFFFF")
 
 
@@ -56,16 +54,20 @@ def is_dark(hexcolor: str) -> bool:
     """
     assert len(hexcolor) == _LEN_HEXCOLOR  # nosec B101
     assert hexcolor[:1] == "#"  # nosec B101
-    if re.search(r"^#[\dA-Fa-f]{6}$", hexcolor) is None:
+    try:
+        # int() already rejects non-hex digits, so no regex is needed
+        value = int(hexcolor[1:], 16)
+    except ValueError as exc:
         msg = "hexcolor must start with '#' and have 6 hexadecimal digits"
-        raise ValueError(msg)
-    r = int(hexcolor[1:3], 16)
-    g = int(hexcolor[3:5], 16)
-    b = int(hexcolor[5:7], 16)
-    # calculate the square of the luminance and compare it to a cutoff value of 127.5²
-    # this way, sqrt() doesn't need to be called
-    hsp = 0.299 * (r * r) + 0.587 * (g * g) + 0.114 * (b * b)
-    return hsp < _DARK_CUTOFF_SQR
+        raise ValueError(msg) from exc
+    r = (value >> 16) & 0xFF
+    g = (value >> 8) & 0xFF
+    b = value & 0xFF
+    # compare the scaled square of the luminance to 127.5**2 * 1000;
+    # scaling the weights by 1000 keeps the math in integers, and the
+    # squares mean sqrt() doesn't need to be called
+    hsp = 299 * (r * r) + 587 * (g * g) + 114 * (b * b)
+    return hsp < _DARK_CUTOFF_SCALED
 
 
 class StyleManager:
@@ -73,6 +75,33 @@ class StyleManager:
     Tk Style Manager.
     """
 
+    _dark_cache: bool | None = None
+    """Cached dark-mode flag, refreshed whenever the theme is applied."""
+
+    _font_cache: ClassVar[dict[str, Font]] = {}
+    """Named-font handles, resolved through the Tk font registry once.
+
+    Cleared by `init_theme`: the handles are bound to one Tcl
+    interpreter, and a restart destroys the root and builds a new one.
+    """
+
+    _menu_colors: ClassVar[WeakKeyDictionary] = WeakKeyDictionary()
+    """The colors last applied to each menu, to skip redundant configures."""
+
+    _label_colors: tuple[str, str] | None = None
+    """Cached TLabel (foreground, background), reset on theme change."""
+
+    @classmethod
+    def _named_font(cls, name: str) -> Font:
+        """
+        Get a named font, caching the handle across calls.
+        """
+        named_font = cls._font_cache.get(name)
+        if named_font is None:
+            named_font = font.nametofont(name)
+            cls._font_cache[name] = named_font
+        return named_font
+
     @classmethod
     def get_dark_mode(cls, settings: Settings) -> bool:
         """
@@ -82,6 +111,9 @@ class StyleManager:
             return True
         if settings.theme == "Light":
             return False
+        # imported here so startup skips the system-theme probe when the
+        # settings pin a theme
+        import darkdetect  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         return darkdetect.isDark()
 
     @classmethod
@@ -89,6 +121,8 @@ class StyleManager:
         """
         Initialize theme and styles for the application.
         """
+        # drop font handles from any previous (now destroyed) interpreter
+        cls._font_cache.clear()
         azure.init_theme(root)  # pylint: disable=W0212
         cls.update_by_dark_mode(root, settings)
         cls.init_fonts(settings)
@@ -110,31 +144,35 @@ class StyleManager:
 
         In addition, widgets are configured to use TkDefaultFont.
         """
-        base_font = font.nametofont("TkDefaultFont")
-        text_font = font.nametofont("TkTextFont")
-        menu_font = font.nametofont("TkMenuFont")
-        fixed_font = font.nametofont("TkFixedFont")
+        base_font = cls._named_font("TkDefaultFont")
+        text_font = cls._named_font("TkTextFont")
+        menu_font = cls._named_font("TkMenuFont")
+        fixed_font = cls._named_font("TkFixedFont")
         if settings.regular_font.name:
-            settings.regular_font.configure_font(base_font)
-            settings.regular_font.configure_font(text_font)
-            settings.regular_font.configure_font(menu_font)
+            regular = settings.regular_font.get_full_font()
+            options: dict[str, Any] = {
+                "family": regular.family, "size": regular.size,
+                "weight": regular.weight, "slant": regular.slant,
+                "underline": regular.underline, "overstrike": regular.overstrike
+            }
         else:
-            base_font.configure(family=font_utils.MAIN_FONT_FAMILY, size=12)
-            text_font.configure(family=font_utils.MAIN_FONT_FAMILY, size=12)
-            menu_font.configure(family=font_utils.MAIN_FONT_FAMILY, size=12)
+            options = {"family": font_utils.MAIN_FONT_FAMILY, "size": 12}
+        for target_font in (base_font, text_font, menu_font):
+            target_font.configure(**options)
         if settings.fixed_font.name:
             settings.fixed_font.configure_font(fixed_font)
         else:
             fixed_font.configure(family=font_utils.FIXED_FONT_FAMILY, size=12)
+        # derived fonts memoized from the old configuration are stale now
+        font_utils.sized_named_font.cache_clear()
         style = ttk.Style()
-        style.configure("TButton", font="TkDefaultFont")
-        style.configure("TRadiobutton", font="TkDefaultFont")
-        style.configure("TLabelFrame", font="TkDefaultFont")
-        style.configure("TNotebook", font="TkDefaultFont")
-        style.configure("TNotebook.Tab", font="TkDefaultFont")
-        style.configure("Switch.TCheckbutton", font="TkDefaultFont")
-        style.configure("System.TLabel", font="TkDefaultFont")
-        style.configure("URL.TLabel", foreground="#0066cc")
+        configure = style.configure
+        for style_name in (
+            "TButton", "TRadiobutton", "TLabelFrame", "TNotebook",
+            "TNotebook.Tab", "Switch.TCheckbutton", "System.TLabel"
+        ):
+            configure(style_name, font="TkDefaultFont")
+        configure("URL.TLabel", foreground="#0066cc")
 
     @classmethod
     def update_by_dark_mode(cls, root: tk.Tk, settings: Settings) -> None:
@@ -149,7 +187,10 @@ class StyleManager:
         * Combobox Listbox background (grey)
         """
         dark_mode = cls.get_dark_mode(settings)
+        # refresh the caches before <<ThemeChanged>> handlers query colors
+        cls._dark_cache = dark_mode
         azure.set_theme("dark" if dark_mode else "light", root)
+        cls._label_colors = None
         root.event_generate("<<ThemeChanged>>")
         style = ttk.Style()
         if dark_mode:
@@ -165,48 +206,78 @@ class StyleManager:
         # ComboboxPopdownFrame must be reset every time the theme changes
         style.configure("ComboboxPopdownFrame", relief=tk.FLAT)
 
+    @classmethod
+    def get_label_colors(cls) -> tuple[str, str]:
+        """
+        Get the TLabel (foreground, background) colors for the theme.
+
+        The two style lookups run once per theme change; widgets built
+        in batches, like the meters, share the cached pair.
+        """
+        if cls._label_colors is None:
+            style = ttk.Style()
+            cls._label_colors = (
+                style.lookup("TLabel", "foreground"),
+                style.lookup("TLabel", "background")
+            )
+        return cls._label_colors
+
     @classmethod
     def test_dark_mode(cls, trueval: T, falseval: T) -> T:
         """
         If currently in dark mode, return `trueval`; otherwise return `falseval`.
+
+        The dark-mode flag is cached by `update_by_dark_mode`; the style
+        lookup only runs when no theme has been applied yet.
         """
-        style = ttk.Style()
-        background = style.lookup("TLabel", "background")
-        if is_dark(f"{background}"):
-            return trueval
-        return falseval
+        if cls._dark_cache is None:
+            style = ttk.Style()
+            background = style.lookup("TLabel", "background")
+            cls._dark_cache = is_dark(f"{background}")
+        return trueval if cls._dark_cache else falseval
 
     @classmethod
     def update_menu(cls, event: tk.Event) -> None:
         """
         Update the foreground and background colors of a menu, based on dark mode.
+
+        Menus already showing the current colors are left alone, so a
+        theme event that does not flip dark mode costs no Tk calls.
         """
-        if isinstance(event.widget, tk.Menu):
-            event.widget.configure(
-                background=cls.get_menu_background(),
-                foreground=cls.get_menu_foreground()
-            )
+        widget = event.widget
+        if isinstance(widget, tk.Menu):
+            colors = (cls.get_menu_background(), cls.get_menu_foreground())
+            if cls._menu_colors.get(widget) == colors:
+                return
+            widget.configure(background=colors[0], foreground=colors[1])
+            cls._menu_colors[widget] = colors
 
     @classmethod
     def get_menu_background(cls) -> str:
         """
         Get the background color for menus, based on dark mode.
+
+        Reads the cached dark-mode flag directly; menus only exist after
+        `init_theme` has populated it.
         """
-        return cls.test_dark_mode("#444444", "#dddddd")
+        return "#444444" if cls._dark_cache else "#dddddd"
 
     @classmethod
     def get_menu_foreground(cls) -> str:
         """
         Get the foreground color for menus, based on dark mode.
+
+        Reads the cached dark-mode flag directly; menus only exist after
+        `init_theme` has populated it.
         """
-        return cls.test_dark_mode("#ffffff", "#000000")
+        return "#ffffff" if cls._dark_cache else "#000000"
 
     @classmethod
     def get_base_font(cls) -> Font:
         """
         Get the base font for use in the application. Returns `TkDefaultFont`.
         """
-        return font.nametofont("TkDefaultFont")
+        return cls._named_font("TkDefaultFont")
 
     @classmethod
     def get_large_font(cls) -> Font:
@@ -244,4 +315,4 @@ class StyleManager:
         """
         Get the monospace font for use in the application. Returns `TkFixedFont`.
         """
-        return font.nametofont("TkFixedFont")
+        return cls._named_font("TkFixedFont")
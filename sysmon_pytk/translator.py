@@ -8,39 +8,60 @@ Information about the app translators.
 from __future__ import annotations
 
 import dataclasses
+from functools import cache
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Translator:
     """
     App translator data.
+
+    Instances are immutable; the GitHub link is derived once at
+    construction time instead of being rebuilt per render.
     """
 
     name: str
     """The translator's name (or pseudonym)."""
     github_username: str = ""
     """The translator's GitHub username, if available. Can be an empty string."""
+    url: str = dataclasses.field(init=False, default="")
+    """The translator's GitHub link; empty when there is no username."""
 
-    def github_url(self) -> str:
+    def __post_init__(self) -> None:
         """
-        Build the translator's github link from their username, if available.
+        Derive the GitHub link from the username.
         """
-        if self.github_username is not None:
-            return f"https://github.com/{self.github_username}"
-        return None
-
-
-TRANSLATORS: dict[str, list[Translator]] = {
-    "Español": [
-        Translator("Stacey Adams (author)"),
-        Translator("Félix Medrano", "robertxgray")
-    ],
-    "Deutsch": [
-        Translator("Alisyn Arness"),
-        Translator("Rainer Schwarzbach", "blackstream-x")
-    ],
-    "Norsk Bokmål": [
-        Translator("Allan Nordhøy", "comradekingu")
-    ]
-}
-"""The translator team, for use in credits."""
+        if self.github_username:
+            object.__setattr__(
+                self, "url", f"https://github.com/{self.github_username}"
+            )
+
+
+_TRANSLATOR_DATA: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    ("Español", (
+        ("Stacey Adams (author)", ""),
+        ("Félix Medrano", "robertxgray")
+    )),
+    ("Deutsch", (
+        ("Alisyn Arness", ""),
+        ("Rainer Schwarzbach", "blackstream-x")
+    )),
+    ("Norsk Bokmål", (
+        ("Allan Nordhøy", "comradekingu"),
+    ))
+)
+"""The translator team data, kept as plain tuples until first use."""
+
+
+@cache
+def get_translators() -> dict[str, list[Translator]]:
+    """
+    Get the translator team, for use in credits.
+
+    The Translator objects are only built when the credits are first
+    shown, and are reused afterwards.
+    """
+    return {
+        language: [Translator(*fields) for fields in team]
+        for language, team in _TRANSLATOR_DATA
+    }
@@ -3,17 +3,16 @@
 
 """
 Various Tk widgets.
+
+Submodules are imported lazily (PEP 562), so consumers only pay the
+import cost — including the Tk image loads in `EditMenu` — for the
+widgets they actually use.
 """
 
-from . import buttons, meters
-from .autoscrollbar import AutoScrollbar
-from .dropdown import DropDown
-from .edit_menu import EditMenu, EditMenuImages
-from .meter import Meter
-from .scalespinner import ScaleSpinner
-from .scrolling_text import ScrollingText
-from .tooltip import TempToolTip, TextToolTip, ToolTip
-from .url_label import UrlLabel
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = [
     "AutoScrollbar",
@@ -30,3 +29,34 @@ __all__ = [
     "buttons",
     "meters",
 ]
+
+_LAZY = {
+    "AutoScrollbar": "autoscrollbar",
+    "DropDown": "dropdown",
+    "EditMenu": "edit_menu",
+    "EditMenuImages": "edit_menu",
+    "Meter": "meter",
+    "ScaleSpinner": "scalespinner",
+    "ScrollingText": "scrolling_text",
+    "TempToolTip": "tooltip",
+    "TextToolTip": "tooltip",
+    "ToolTip": "tooltip",
+    "UrlLabel": "url_label",
+    "buttons": "buttons",
+    "meters": "meters",
+}
+"""Which submodule provides each lazily-imported name."""
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """
+    Resolve a widget name on first access, then cache it in the module.
+    """
+    try:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+    except KeyError as exc:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from exc
+    value = module if name == _LAZY[name] else getattr(module, name)
+    globals()[name] = value
+    return value
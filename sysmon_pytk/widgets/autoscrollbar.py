@@ -24,10 +24,34 @@ class AutoScrollbar(ttk.Scrollbar):  # pylint: disable=too-many-ancestors
     A scrollbar that automatically removes itself when not needed.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Construct an AutoScrollbar.
+
+        Parameters
+        ----------
+        *args : tuple, optional
+            Arguments to pass to parent `Scrollbar` class.
+        **kwargs : dict, optional
+            Arguments to pass to parent `Scrollbar` class.
+        """
+        super().__init__(*args, **kwargs)
+        # last-applied visibility, so steady-state scrolling skips grid calls
+        self._hidden: bool | None = None
+        # visibility wanted by the most recent set() call
+        self._want_hidden = False
+        # whether an idle callback is already scheduled
+        self._pending = False
+
     def set(self, first: Any, last: Any) -> None:  # noqa: ANN401
         """
         Set the fractional values of the slider position.
 
+        Tk calls this on every scroll event; visibility changes are
+        coalesced through after_idle so a burst of events that flips
+        visibility back and forth costs at most one grid()/grid_remove()
+        per event-loop cycle.
+
         Parameters
         ----------
         first : Any
@@ -35,11 +59,27 @@ class AutoScrollbar(ttk.Scrollbar):  # pylint: disable=too-many-ancestors
         last : Any
             A string representation of a float, between 0 and 1.
         """
-        if float(first) <= 0 and float(last) >= 1:
+        self._want_hidden = (
+            (first if isinstance(first, float) else float(first)) <= 0
+            and (last if isinstance(last, float) else float(last)) >= 1
+        )
+        if self._want_hidden != self._hidden and not self._pending:
+            self._pending = True
+            self.after_idle(self._apply_visibility)
+        super().set(first, last)
+
+    def _apply_visibility(self) -> None:
+        """
+        Apply the most recently requested visibility, once per idle tick.
+        """
+        self._pending = False
+        if self._want_hidden == self._hidden:
+            return
+        if self._want_hidden:
             self.grid_remove()
         else:
             self.grid()
-        super().set(first, last)
+        self._hidden = self._want_hidden
 
     def pack(self, **_kwargs):  # noqa: ANN201
         """
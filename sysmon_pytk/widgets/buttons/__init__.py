@@ -10,6 +10,7 @@ from __future__ import annotations
 import dataclasses
 import tkinter as tk
 from enum import IntEnum
+from functools import partial
 from tkinter import ttk
 from typing import Any, Callable, TypeVar, Union
 
@@ -44,12 +45,25 @@ class ButtonName(IntEnum):
     """Retry button."""
 
 
+_BUTTON_TEXTS = (
+    (ButtonName.OK, _("OK")),
+    (ButtonName.CANCEL, _("Cancel")),
+    (ButtonName.CLOSE, _("Close")),
+    (ButtonName.YES, _("Yes")),
+    (ButtonName.NO, _("No")),
+    (ButtonName.RETRY, _("Retry"))
+)
+"""The label for each standard button, translated once per language load."""
+
+
 @dataclasses.dataclass
 class ButtonDefinition:
     """
     Necessary metadata for creating a button.
     """
 
+    __slots__ = ("text", "command")
+
     text: str
     """The text to appear on the button."""
     command: Callable[[], Any]
@@ -93,10 +107,7 @@ class ButtonMixin:  # pylint: disable=too-few-public-methods
         self.toplevel = frame.winfo_toplevel()
         max_columns, max_rows = frame.grid_size()
         buttonframe = ttk.Frame(frame)
-        buttonframe.grid(
-            row=max_rows, column=0, sticky=tk.E, columnspan=max_columns,
-            pady=(0, INTERNAL_PAD)
-        )
+        padx = INTERNAL_PAD / 2
         for num, button in enumerate(buttons):
             btn = ttk.Button(buttonframe, text=button.text, command=button.command)
             if num == default:
@@ -107,31 +118,22 @@ class ButtonMixin:  # pylint: disable=too-few-public-methods
                 self.toplevel.bind(
                     "<KeyPress-KP_Enter>", button.command  # type: ignore[arg-type]
                 )
-            btn.grid(row=0, column=num, padx=INTERNAL_PAD/2)
+            btn.grid(row=0, column=num, padx=padx)
+        # gridded last, so the frame is laid out once with all of its
+        # buttons in place instead of reflowing as each one is added
+        buttonframe.grid(
+            row=max_rows, column=0, sticky=tk.E, columnspan=max_columns,
+            pady=(0, INTERNAL_PAD)
+        )
 
     def init_standard_buttons(self) -> None:
         """
         Define the button definitions.
         """
         self.button_definitions = {
-            ButtonName.OK: ButtonDefinition(
-                text=_("OK"), command=lambda: self._set_result(ButtonName.OK)
-            ),
-            ButtonName.CANCEL: ButtonDefinition(
-                text=_("Cancel"), command=lambda: self._set_result(ButtonName.CANCEL)
-            ),
-            ButtonName.CLOSE: ButtonDefinition(
-                text=_("Close"), command=lambda: self._set_result(ButtonName.CLOSE)
-            ),
-            ButtonName.YES: ButtonDefinition(
-                text=_("Yes"), command=lambda: self._set_result(ButtonName.YES)
-            ),
-            ButtonName.NO: ButtonDefinition(
-                text=_("No"), command=lambda: self._set_result(ButtonName.NO)
-            ),
-            ButtonName.RETRY: ButtonDefinition(
-                text=_("Retry"), command=lambda: self._set_result(ButtonName.RETRY)
-            ),
+            name: ButtonDefinition(
+                text=text, command=partial(self._set_result, name)
+            ) for name, text in _BUTTON_TEXTS
         }
 
     def _set_result(self, value: ButtonName) -> None:
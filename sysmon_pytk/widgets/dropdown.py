@@ -44,21 +44,33 @@ class DropDown(ttk.Combobox):
             Additional keyword arguments for a `Combobox`.
         """
         super().__init__(
-            parent, values=sorted(dictionary.keys()), **kwargs
+            parent, values=tuple(sorted(dictionary)), **kwargs
         )
         self.dictionary = dictionary
+        # value → key lookup, built once instead of scanned on every set()
+        self._reverse = {value: key for key, value in dictionary.items()}
+        # the mapped value of the current selection, kept in sync so
+        # get() is a plain attribute read instead of a Tcl call
+        self._current = ""
+        self.bind("<<ComboboxSelected>>", self._on_select)
+
+    def _on_select(self, _event: object) -> None:
+        """
+        Cache the mapped value when the user picks an entry.
+        """
+        self._current = self.dictionary.get(ttk.Combobox.get(self), "")
 
     def get(self) -> str:
         """
         Get the selected value of the dropdown.
         """
-        key = super().get()
-        return self.dictionary[key] if key else ""
+        return self._current
 
     def set(self, value: str) -> None:
         """
         Set the value of the dropdown, if value is found in the dictionary.
         """
-        keys = [key for key, val in self.dictionary.items() if val == value]
-        if len(keys) > 0:
-            super().set(keys[0])
+        key = self._reverse.get(value)
+        if key is not None:
+            super().set(key)
+            self._current = value
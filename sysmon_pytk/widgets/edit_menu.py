@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import dataclasses
 import tkinter as tk
+from typing import ClassVar
 
 from ..app_locale import get_translator
 from ..file_utils import get_full_path
@@ -22,6 +23,8 @@ class EditMenuImages:
     Images used for the Edit Menu.
     """
 
+    __slots__ = ("cut", "copy", "paste", "select_all")
+
     cut: tk.PhotoImage
     """Image for Cut."""
     copy: tk.PhotoImage
@@ -42,6 +45,9 @@ class EditMenu(tk.Menu):
         A collection of images needed for the menu.
     """
 
+    _image_cache: ClassVar[dict[int, EditMenuImages]] = {}
+    """Decoded menu images, shared per Tk interpreter across instances."""
+
     def __init__(self, master: tk.Text, **kwarg) -> None:
         """
         Construct an edit menu for a Text widget.
@@ -55,12 +61,20 @@ class EditMenu(tk.Menu):
         """
         self.master: tk.Text = master
         super().__init__(master, **kwarg)
-        self.images = EditMenuImages(
-            cut=tk.PhotoImage(file=get_full_path("images/edit-cut.png")),
-            copy=tk.PhotoImage(file=get_full_path("images/edit-copy.png")),
-            paste=tk.PhotoImage(file=get_full_path("images/edit-paste.png")),
-            select_all=tk.PhotoImage(file=get_full_path("images/edit-select-all.png"))
-        )
+        # decode the PNGs once per interpreter; later menus reuse them
+        root_id = id(master.winfo_toplevel().tk)
+        images = EditMenu._image_cache.get(root_id)
+        if images is None:
+            images = EditMenuImages(
+                cut=tk.PhotoImage(file=get_full_path("images/edit-cut.png")),
+                copy=tk.PhotoImage(file=get_full_path("images/edit-copy.png")),
+                paste=tk.PhotoImage(file=get_full_path("images/edit-paste.png")),
+                select_all=tk.PhotoImage(file=get_full_path("images/edit-select-all.png"))
+            )
+            EditMenu._image_cache[root_id] = images
+        self.images = images
+        # the Cut/Paste entry state last applied to the menu
+        self._entries_disabled: bool | None = None
         self.add_command(
             label=_("Cut"), command=self.cut, accelerator=_("Ctrl+X"),
             compound=tk.LEFT, image=self.images.cut
@@ -87,15 +101,18 @@ class EditMenu(tk.Menu):
     def show_popup(self, event: tk.Event) -> None:
         """
         Show the edit menu.
+
+        The Cut/Paste entries are only reconfigured when the Text
+        widget's state has changed since the last popup.
         """
         if self.focus_get() != self:
             self.focus_set()
-        if self.master.cget("state") == tk.DISABLED:
-            self.entryconfigure(_("Cut"), state=tk.DISABLED)
-            self.entryconfigure(_("Paste"), state=tk.DISABLED)
-        else:
-            self.entryconfigure(_("Cut"), state=tk.NORMAL)
-            self.entryconfigure(_("Paste"), state=tk.NORMAL)
+        disabled = self.master.cget("state") == tk.DISABLED
+        if disabled != self._entries_disabled:
+            state = tk.DISABLED if disabled else tk.NORMAL
+            self.entryconfigure(_("Cut"), state=state)
+            self.entryconfigure(_("Paste"), state=state)
+            self._entries_disabled = disabled
         self.tk_popup(event.x_root, event.y_root, 0)
 
     def cut(self, *_args) -> None:
@@ -12,10 +12,9 @@ from __future__ import annotations
 
 import dataclasses
 import tkinter as tk
-from tkinter import ttk
 from typing import TYPE_CHECKING
 
-from ..font_utils import modify_named_font
+from ..font_utils import sized_named_font
 from ..style_manager import StyleManager
 
 if TYPE_CHECKING:
@@ -90,15 +89,23 @@ class Meter(tk.Frame):
             Arguments to pass to parent `Frame` class.
         """
         self._unit = unit
+        # prebuilt %-formatter for the current-value text; the unit is
+        # escaped since "%" is the most common one
+        self._format_value = ("%.1f" + unit.replace("%", "%%")).__mod__
         self._min_value = min_value
         self._max_value = max_value
         self._width = width
         self._height = height
         self._divisions = divisions
-        self.range = {"blue": blue, "yellow": yellow, "red": red}
+        # band thresholds as percentages, resolved once for the hot path
+        self._blue_threshold = blue
+        self._red_threshold = 100 - red
+        self._yellow_threshold = 100 - red - yellow
         self.check_dark_mode()
         super().__init__(parent, background=self._background, class_="Meter", **kw)
-        self.var = tk.DoubleVar(self, 0)
+        # the displayed value, kept Python-side so updates skip the
+        # Tcl string round-trip a DoubleVar would impose
+        self._value = 0.0
         self.rowconfigure(0, weight=1)
         self.columnconfigure(0, weight=1)
         # This `canvas_holder` frame is to keep the canvas centered in the widget.
@@ -113,38 +120,49 @@ class Meter(tk.Frame):
             highlightthickness=0
         )
         self.canvas_objects = CanvasObjects()
+        # bound once so the refresh path skips the method lookups
+        self._itemconfig = self.canvas.itemconfig
+        # the band color currently applied to the indicator
+        self._last_band: str | None = None
+        # the value last pushed to the display
+        self._last_set: float | None = None
+        # the string currently shown by the "current" text item
+        self._last_text = ""
         self._add_labels(label, unit)
         self._add_gauge_lines(red, yellow, blue)
         self._add_inset()
         self._update_meter_line(Meter.EXTENT_ANGLE + Meter.START_ANGLE)
-        self.var.trace_add("write", self._update_meter)
         self.canvas.grid(sticky=tk.EW)
 
     def _add_labels(self, label: str, unit: str) -> None:
         font_size_lg = int(self._height / 15)
         font_size_sm = int(self._height / 20)
-        text_font = modify_named_font("TkDefaultFont", size=font_size_lg)
-        large_font = modify_named_font("TkFixedFont", size=font_size_lg)
-        small_font = modify_named_font("TkFixedFont", size=font_size_sm)
+        text_font = sized_named_font("TkDefaultFont", font_size_lg)
+        large_font = sized_named_font("TkFixedFont", font_size_lg)
+        small_font = sized_named_font("TkFixedFont", font_size_sm)
         # Add text: label, mix, max, current
         self.canvas_objects.label1 = self.canvas.create_text(
             self._width / 2, self._height / 10,
-            font=text_font, text=label, fill=self._text_color
+            font=text_font, text=label, fill=self._text_color,
+            tags=("meter_text",)
         )
         self.canvas_objects.min_value = self.canvas.create_text(
             self._width / 6, self._height * 0.55,
             font=small_font, text=f"{int(self._min_value)}{unit}",
-            fill=self._text_color, anchor=tk.NE, justify=tk.RIGHT
+            fill=self._text_color, anchor=tk.NE, justify=tk.RIGHT,
+            tags=("meter_text",)
         )
         self.canvas_objects.max_value = self.canvas.create_text(
             self._width * 5 / 6, self._height * 0.55,
             font=small_font, text=f"{int(self._max_value)}{unit}",
-            fill=self._text_color, anchor=tk.NW, justify=tk.LEFT
+            fill=self._text_color, anchor=tk.NW, justify=tk.LEFT,
+            tags=("meter_text",)
         )
         self.canvas_objects.current = self.canvas.create_text(
             self._width / 2, self._height - 1.75*font_size_lg,
-            font=large_font, text=f"{self.var.get()}{self._unit}",
-            fill=self._text_color, anchor=tk.N, justify=tk.CENTER
+            font=large_font, text=f"{self._value}{self._unit}",
+            fill=self._text_color, anchor=tk.N, justify=tk.CENTER,
+            tags=("meter_text",)
         )
 
     def _add_gauge_lines(self, red: float, yellow: float, blue: float) -> None:
@@ -153,13 +171,14 @@ class Meter(tk.Frame):
             self._width * 29 / 30, self._height * 1.5
         )
         # Add the divisions
-        self.canvas_objects.wedges = []
-        for i in range(self._divisions):
-            self.canvas_objects.wedges.append(self.canvas.create_arc(
+        step = Meter.EXTENT_ANGLE / self._divisions
+        starts = [Meter.START_ANGLE + i*step for i in range(self._divisions)]
+        self.canvas_objects.wedges = [
+            self.canvas.create_arc(
                 coord, width=1, outline=self._text_color,
-                start=(i * (Meter.EXTENT_ANGLE / self._divisions) + Meter.START_ANGLE),
-                extent=(Meter.EXTENT_ANGLE / self._divisions)
-            ))
+                start=start, extent=step, tags=("meter_wedge",)
+            ) for start in starts
+        ]
 
         # Add the color scale arcs
         self.canvas.create_arc(
@@ -198,20 +217,20 @@ class Meter(tk.Frame):
         )
         self.canvas_objects.inset = self.canvas.create_arc(
             inset_coord, start=Meter.START_ANGLE, extent=Meter.EXTENT_ANGLE,
-            fill=self._text_color, outline=self._text_color, width=2
+            fill=self._text_color, outline=self._text_color, width=2,
+            tags=("meter_inset",)
         )
         self.canvas_objects.inset_border = self.canvas.create_arc(
             inset_coord, start=Meter.START_ANGLE, extent=Meter.EXTENT_ANGLE,
-            outline=self._meter_color, style="arc", width=1
+            outline=self._meter_color, style="arc", width=1,
+            tags=("meter_inset",)
         )
 
     def check_dark_mode(self) -> None:
         """
         Detect whether using dark mode and adjust base colors.
         """
-        style = ttk.Style()
-        self._text_color = style.lookup("TLabel", "foreground")
-        self._background = style.lookup("TLabel", "background")
+        self._text_color, self._background = StyleManager.get_label_colors()
         self._meter_color = StyleManager.test_dark_mode("#cccccc", "#666666")
         self._meter_red = StyleManager.test_dark_mode("#ff2222", "#cc0000")
         self._meter_yellow = StyleManager.test_dark_mode("#ffff22", "#cccc00")
@@ -220,47 +239,77 @@ class Meter(tk.Frame):
     def update_for_dark_mode(self) -> None:
         """
         Update the meter colors based on detected dark mode.
+
+        Items are recolored through their shared canvas tags, so each
+        color group costs one itemconfig instead of one per item.
         """
         self.check_dark_mode()
         self.canvas.config(background=self._background)
-        self.canvas.itemconfig(self.canvas_objects.label1, fill=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.min_value, fill=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.max_value, fill=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.current, fill=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.meter, fill=self._meter_color)
-        self.canvas.itemconfig(self.canvas_objects.meter, outline=self._meter_color)
+        self.canvas.itemconfig("meter_text", fill=self._text_color)
+        self.canvas.itemconfig("meter_wedge", outline=self._text_color)
+        self.canvas.itemconfig("meter_inset", outline=self._text_color)
         self.canvas.itemconfig(self.canvas_objects.inset, fill=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.inset, outline=self._text_color)
-        self.canvas.itemconfig(self.canvas_objects.inset_border, outline=self._text_color)
-        for wedge in self.canvas_objects.wedges:
-            self.canvas.itemconfig(wedge, outline=self._text_color)
+        self.canvas.itemconfig(
+            self.canvas_objects.meter,
+            fill=self._meter_color, outline=self._meter_color
+        )
+        self._last_band = self._meter_color
+        # the indicator was just repainted in the neutral color, so the
+        # next set_value must repaint even if the reading hasn't moved
+        self._last_set = None
 
     def _update_meter_line(self, angle: float) -> None:
         """
         Update the meter line indicator.
+
+        The current-value text is only rewritten when the rendered
+        string changes, sparing Tk a text re-layout on steady ticks.
         """
         self.canvas.itemconfig(self.canvas_objects.meter, start=angle)
-        self.canvas.itemconfig(self.canvas_objects.current, text=f"{self.var.get()}{self._unit}")
+        text = self._format_value(self._value)
+        if text != self._last_text:
+            self.canvas.itemconfig(self.canvas_objects.current, text=text)
+            self._last_text = text
 
-    def _update_meter(self, _name1, _name2, _op) -> None:
+    def _update_meter(self, value: float) -> None:
         """
-        Update the meter display based on the updated variable.
+        Update the meter display for a new value.
+
+        The indicator's angle and color travel in one itemconfig call;
+        the color keywords are only included when the band changed.
+
+        Parameters
+        ----------
+        value : float
+            The value to display.
         """
-        pct = (self.var.get() - self._min_value)/(self._max_value - self._min_value)
-        if pct * 100 < self.range["blue"]:
-            self.canvas.itemconfig(self.canvas_objects.meter, fill=self._meter_blue)
-            self.canvas.itemconfig(self.canvas_objects.meter, outline=self._meter_blue)
-        elif pct * 100 > 100 - self.range["red"]:
-            self.canvas.itemconfig(self.canvas_objects.meter, fill=self._meter_red)
-            self.canvas.itemconfig(self.canvas_objects.meter, outline=self._meter_red)
-        elif pct * 100 > 100 - self.range["red"] - self.range["yellow"]:
-            self.canvas.itemconfig(self.canvas_objects.meter, fill=self._meter_yellow)
-            self.canvas.itemconfig(self.canvas_objects.meter, outline=self._meter_yellow)
-        else:
-            self.canvas.itemconfig(self.canvas_objects.meter, fill=self._meter_color)
-            self.canvas.itemconfig(self.canvas_objects.meter, outline=self._meter_color)
+        pct = (value - self._min_value)/(self._max_value - self._min_value)
+        band = self._band_for(pct * 100)
         angle = (1 - pct) * Meter.EXTENT_ANGLE + Meter.START_ANGLE
-        self._update_meter_line(angle)
+        itemconfig = self._itemconfig
+        if band != self._last_band:
+            itemconfig(
+                self.canvas_objects.meter, start=angle, fill=band, outline=band
+            )
+            self._last_band = band
+        else:
+            itemconfig(self.canvas_objects.meter, start=angle)
+        text = self._format_value(value)
+        if text != self._last_text:
+            itemconfig(self.canvas_objects.current, text=text)
+            self._last_text = text
+
+    def _band_for(self, pct100: float) -> str:
+        """
+        Pick the indicator color for a reading, as a percent of the range.
+        """
+        if pct100 < self._blue_threshold:
+            return self._meter_blue
+        if pct100 > self._red_threshold:
+            return self._meter_red
+        if pct100 > self._yellow_threshold:
+            return self._meter_yellow
+        return self._meter_color
 
     @classmethod
     def _percent_to_degrees(cls, pct: float) -> float:
@@ -269,8 +318,16 @@ class Meter(tk.Frame):
     def set_value(self, value: float) -> None:
         """
         Set the value to display on the meter.
+
+        Values that round to the same displayed reading as the current
+        one are dropped, so noise below the display resolution costs no
+        canvas updates.
         """
-        self.var.set(value)
+        if self._last_set is not None and round(value, 1) == round(self._last_set, 1):
+            return
+        self._last_set = value
+        self._value = value
+        self._update_meter(value)
 
     def bind(self, sequence=None, func=None, add=None):  # noqa: ANN001,ANN201
         """
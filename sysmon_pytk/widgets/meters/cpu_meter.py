@@ -14,9 +14,9 @@ from typing import TYPE_CHECKING
 
 import psutil
 
-from ... import modals
 from ...app_locale import get_translator
 from ...file_utils import get_full_path
+from ...sampler import SAMPLER
 from .updating_meter import UpdatingMeter
 
 if TYPE_CHECKING:
@@ -62,12 +62,14 @@ class CpuMeter(UpdatingMeter):
         """
         Get the value that should update the meter.
         """
-        return psutil.cpu_percent(interval=None)
+        return SAMPLER.cpu_percent()
 
     def on_click(self, *_args) -> None:
         """
         Open CPU Details.
         """
+        # imported on demand so building a meter never loads the dialogs
+        from ... import modals  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         app_title = self.get_app_title()
         modals.CpuDialog(
             self, title=_("{} :: CPU Details").format(app_title),
@@ -12,12 +12,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import psutil
-
-from ... import modals
 from ..._common import DISK_ALERT_LEVEL, DISK_WARN_LEVEL
 from ...app_locale import get_translator
 from ...file_utils import get_full_path
+from ...sampler import SAMPLER
 from .updating_meter import UpdatingMeter
 
 if TYPE_CHECKING:
@@ -57,12 +55,14 @@ class DiskMeter(UpdatingMeter):
         """
         Get the value that should update the meter.
         """
-        return psutil.disk_usage("/").percent
+        return SAMPLER.disk_percent("/")
 
     def on_click(self, *_args) -> None:
         """
         Open Disk Usage.
         """
+        # imported on demand so building a meter never loads the dialogs
+        from ... import modals  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         app_title = self.get_app_title()
         modals.DiskUsageDialog(
             self, title=_("{} :: Disk Usage").format(app_title),
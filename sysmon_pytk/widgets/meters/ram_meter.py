@@ -12,11 +12,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import psutil
-
-from ... import modals
 from ...app_locale import get_translator
 from ...file_utils import get_full_path
+from ...sampler import SAMPLER
 from .updating_meter import UpdatingMeter
 
 if TYPE_CHECKING:
@@ -56,12 +54,14 @@ class RamMeter(UpdatingMeter):
         """
         Get the value that should update the meter.
         """
-        return psutil.virtual_memory().percent
+        return SAMPLER.memory_percent()
 
     def on_click(self, *_args) -> None:
         """
         Open Memory Usage.
         """
+        # imported on demand so building a meter never loads the dialogs
+        from ... import modals  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         app_title = self.get_app_title()
         modals.MemUsageDialog(
             self, title=_("{} :: Memory Usage").format(app_title),
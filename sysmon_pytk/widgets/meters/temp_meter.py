@@ -12,10 +12,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ... import modals
-from ..._common import cpu_temp
 from ...app_locale import get_translator
 from ...file_utils import get_full_path
+from ...sampler import SAMPLER
 from .updating_meter import UpdatingMeter
 
 if TYPE_CHECKING:
@@ -55,12 +54,14 @@ class TempMeter(UpdatingMeter):
         """
         Get the value that should update the meter.
         """
-        return cpu_temp()
+        return SAMPLER.temperature()
 
     def on_click(self, *_args) -> None:
         """
         Open Temperature Details.
         """
+        # imported on demand so building a meter never loads the dialogs
+        from ... import modals  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
         app_title = self.get_app_title()
         modals.TempDetailsDialog(
             self,
@@ -10,8 +10,9 @@ Updating Meter widget base class.
 
 from __future__ import annotations
 
+import time
 from abc import abstractmethod
-from typing import TYPE_CHECKING, final
+from typing import TYPE_CHECKING, ClassVar, final
 
 from ..._common import REFRESH_INTERVAL
 from ...app_locale import get_translator
@@ -27,8 +28,21 @@ _ = get_translator()
 class UpdatingMeter(Meter):
     """
     A Meter that can update itself.
+
+    All live meters share one class-level refresh timer: each tick runs
+    every subscriber in a single pass and schedules one successor, so N
+    meters wake the event loop once per interval instead of N times.
     """
 
+    _subscribers: ClassVar[list[UpdatingMeter]] = []
+    """The meters refreshed by the shared timer."""
+
+    _tick_root: Misc | None = None
+    """The widget the shared timer is scheduled on."""
+
+    _tick_job: str | None = None
+    """The id of the pending shared timer event, if any."""
+
     def __init__(
         self, parent: Misc, *, width: int = 300, height: int = 225, **kw
     ) -> None:
@@ -49,17 +63,66 @@ class UpdatingMeter(Meter):
         super().__init__(
             parent, width=width, height=height, **kw
         )
-        self._update_job: str | None = None
+        # tracked via <Map>/<Unmap> so each tick needs no winfo call
+        self._mapped = False
+        # set during teardown so an in-flight tick can't touch a dead canvas
+        self._destroyed = False
         self.bind("<<ThemeChanged>>", self._update_theme)
         self.bind("<Destroy>", self.on_destroy)
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
         if self.is_clickable():
             self.bind("<Button-1>", self.on_click)
             self.configure(cursor="hand2")
         self.update_widget()
+        self._subscribe()
+
+    def _subscribe(self) -> None:
+        """
+        Join the shared refresh timer, starting it if necessary.
+        """
+        cls = UpdatingMeter
+        cls._subscribers.append(self)
+        if cls._tick_job is None:
+            cls._tick_root = self.winfo_toplevel()
+            cls._tick_job = cls._tick_root.after(REFRESH_INTERVAL, cls._tick)
+
+    @classmethod
+    def _tick(cls) -> None:
+        """
+        Refresh every subscribed meter, then schedule the next tick.
+
+        The time the pass itself took is deducted from the next delay,
+        so the cadence tracks the wall clock instead of drifting, and a
+        slow sample can't queue up catch-up ticks.
+        """
+        start = time.monotonic()
+        for meter in list(cls._subscribers):
+            meter.update_widget()
+        if cls._subscribers and cls._tick_root is not None:
+            elapsed_ms = int((time.monotonic() - start) * 1000)
+            cls._tick_job = cls._tick_root.after(
+                max(1, REFRESH_INTERVAL - elapsed_ms), cls._tick
+            )
+        else:
+            cls._tick_job = None
 
     def _update_theme(self, *_args) -> None:
         super().update_for_dark_mode()
 
+    def _on_map(self, *_args) -> None:
+        """
+        Resume refreshing when the meter becomes visible again.
+        """
+        self._mapped = True
+        self.set_value(self.get_value())
+
+    def _on_unmap(self, *_args) -> None:
+        """
+        Stop refreshing while the meter is not visible.
+        """
+        self._mapped = False
+
     def is_clickable(self) -> bool:
         """
         Determine if this Meter is clickable.
@@ -74,11 +137,18 @@ class UpdatingMeter(Meter):
 
     def on_destroy(self, *_args) -> None:
         """
-        Cancel the update job when widget is destroyed.
+        Leave the shared refresh timer when widget is destroyed.
+
+        The timer stops once no subscribers remain.
         """
-        if self._update_job is not None:
-            self.after_cancel(self._update_job)
-            self._update_job = None
+        self._destroyed = True
+        cls = UpdatingMeter
+        if self in cls._subscribers:
+            cls._subscribers.remove(self)
+        if not cls._subscribers and cls._tick_job is not None:
+            if cls._tick_root is not None:
+                cls._tick_root.after_cancel(cls._tick_job)
+            cls._tick_job = None
 
     @abstractmethod
     def on_click(self, *args) -> None:
@@ -107,7 +177,11 @@ class UpdatingMeter(Meter):
     @final
     def update_widget(self) -> None:
         """
-        Update the Meter.
+        Update the Meter once; scheduling is handled by the shared timer.
+
+        Unmapped meters — on a hidden tab or an iconified window — skip
+        the sample and the canvas work entirely; <Map> refreshes them
+        immediately when they reappear.
         """
-        self.set_value(self.get_value())
-        self._update_job = self.after(REFRESH_INTERVAL, self.update_widget)
+        if self._mapped and not self._destroyed:
+            self.set_value(self.get_value())